@@ -5,29 +5,194 @@ A bot that automates Scrum processes by leveraging RingCentral, JIRA, and LLMs.
 
 import os
 import re
-import json
+import math
 import time
 import requests
-from datetime import datetime, timedelta
+import functools
+import itertools
+import services
+from collections import OrderedDict
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Command parsing relies on the precompiled _RE_* patterns below; the larger
+# cache only protects any ad-hoc re.search calls from cache-flush recompiles
+re._MAXCACHE = max(getattr(re, '_MAXCACHE', 512), 2048)
+
+# Load environment variables once; module globals survive importlib.reload,
+# so a reload keeps the flag and skips re-parsing the .env file
+_DOTENV_LOADED = globals().get('_DOTENV_LOADED', False)
+if not _DOTENV_LOADED:
+    load_dotenv()
+    _DOTENV_LOADED = True
 
 # Constants
 JIRA_HOST = os.environ.get('JIRA_HOST', 'https://jira.company.com')
 JIRA_PAT = os.environ.get('JIRA_PAT')
 JIRA_STORY_POINTS_FIELD = os.environ.get('JIRA_STORY_POINTS_FIELD', 'customfield_10002')
 
+# Directory for the bot's local SQLite stores (meetings, search index, tasks)
+DATA_DIR = os.environ.get('DATA_DIR', 'data')
+
+# Default (connect, read) timeouts in seconds for JIRA requests
+JIRA_TIMEOUT = (5.0, 10.0)
+
+# Default (connect, read) timeouts in seconds for OpenAI REST calls; batch
+# uploads and result downloads can take longer to answer than a JIRA call
+OPENAI_TIMEOUT = (5.0, 60.0)
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout when a call does not set its own."""
+
+    def __init__(self, *args, timeout=JIRA_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+def _pooled_session(timeout):
+    """Build an HTTP session with pooled keep-alive connections, a default timeout and retries."""
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(
+        timeout=timeout,
+        pool_connections=16,
+        pool_maxsize=32,
+        # Transient failures are retried with exponential backoff, honouring
+        # Retry-After; only idempotent methods are retried once a request was sent
+        max_retries=Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=5,
+            backoff_factor=0.4,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Shared HTTP sessions so JIRA and OpenAI calls reuse pooled connections
+_JIRA_SESSION = _pooled_session(JIRA_TIMEOUT)
+_OPENAI_SESSION = _pooled_session(OPENAI_TIMEOUT)
+
+def get_jira_session():
+    """Return the pooled HTTP session used for all JIRA calls."""
+    return _JIRA_SESSION
+
+def get_openai_session():
+    """Return the pooled HTTP session used for direct OpenAI REST calls."""
+    return _OPENAI_SESSION
+
+# Pre-compiled command parsing patterns
+_RE_COMMAND = re.compile(r'!\[:Person\]\([^)]+\)\s+([\w-]+)')
+# Keys the commands understand; a value ends at a comma, the end of the text or
+# the next one of these keys, so `hours: 2 comment: fixed bug` splits into both
+# pairs while free text such as `10:30` or `https://...` stays in its value
+_COMMAND_KEYS = (
+    'project', 'summary', 'type', 'priority', 'description', 'os', 'status', 'assignee',
+    'story-points', 'comment', 'hours', 'sprint', 'topic', 'jira', 'due'
+)
+_RE_KV = re.compile(
+    r'(\w[\w-]*)\s*:\s*([^,]+?)(?=\s+(?:' + '|'.join(_COMMAND_KEYS) + r')\s*:|,|$)',
+    re.IGNORECASE
+)
+_RE_TICKET_FIELDS = re.compile(r'\b(project|summary|type|priority|description|os)\s*:\s*([^,]+)', re.IGNORECASE)
+
 # Initialize module-level dictionaries to store data
-meeting_memory = {}
+meeting_memory = OrderedDict()
 dev_tasks = {}
 sprint_data = {}
 
+# Maximum number of meetings kept in memory; the oldest ones are evicted first.
+# meeting_memory is a read cache in front of services.meeting_store.
+MAX_MEETINGS = 256
+_meeting_counter = itertools.count(1)
+
+def new_meeting_id():
+    """Return a unique meeting ID, even for transcripts stored in the same second."""
+    return f"m{next(_meeting_counter)}_{time.time_ns()}"
+
+def remember_meeting(meeting_id, record):
+    """Store a meeting record, evicting the oldest meetings beyond the cap."""
+    meeting_memory[meeting_id] = record
+    meeting_memory.move_to_end(meeting_id)
+    while len(meeting_memory) > MAX_MEETINGS:
+        meeting_memory.popitem(last=False)
+
 __name__ = 'localConfig'
 __package__ = 'ringcentral_bot_framework'
 
+def _parse_kv(text):
+    """Parse all `key: value` pairs of a command in a single pass."""
+    return {m.group(1).lower(): m.group(2).strip() for m in _RE_KV.finditer(text)}
+
+def _command_arg(text, command):
+    """Return the first token following the command name, if any."""
+    i = text.lower().find(command)
+    if i < 0:
+        return None
+    rest = text[i + len(command):].split(None, 1)
+    return rest[0].rstrip(",") if rest else None
+
+def _is_ticket_key(value):
+    """Check that a value looks like a JIRA key such as PROJ-123."""
+    if not value:
+        return False
+    project, _, number = value.rpartition("-")
+    return bool(project) and project.replace("_", "").isalnum() and number.isdigit()
+
+# Canned replies; each is sent after an "![:Person](creator), " mention prefix
+_TEMPLATES = {
+    "unknown_command": "I don't recognize that command. Type `![:Person]({bot_id}) help` for a list of available commands.",
+    "ticket_missing_fields": "please provide at least the project and summary to create a ticket.",
+    "ticket_created": "a JIRA ticket has been created for the issue: \"{summary}\".\n\n"
+                      "**Details:**\n"
+                      "- **Description:** {description}\n"
+                      "- **Issue Type:** {issue_type}\n"
+                      "Ticket ID: \"{ticket_id}\". [View Ticket]({jira_url})",
+    "ticket_create_failed": "failed to create a JIRA ticket for the issue: \"{summary}\".\n"
+                            "Please try again later.",
+    "ticket_key_missing": "please provide a valid ticket key to update.",
+    "ticket_updated": "successfully updated ticket {ticket}.",
+    "ticket_update_failed": "failed to update ticket {ticket}.",
+    "log_time_missing": "please provide both ticket key and hours to log time.",
+    "time_logged": "successfully logged {hours} hours to ticket {ticket}.",
+    "log_time_failed": "failed to log time to ticket {ticket}.",
+    "sprint_health_error": "error retrieving sprint health: {error}",
+    "task_description_missing": "please provide a task description.",
+    "invalid_date": "invalid date format. Please use YYYY-MM-DD.",
+    "task_added": "I've added your task: \"{description}\"{due_text}{jira_text}.\n\n"
+                  "Task ID: {task_id}. You can update it later with `![:Person]({bot_id}) update-task {task_id} status: completed`",
+    "task_add_failed": "failed to add your task. Please try again.",
+    "task_update_usage": "please provide both task ID and status.\n"
+                         "Example: `![:Person]({bot_id}) update-task task-123 status: completed`",
+    "task_updated": "task {task_id} has been updated to status: {status}.",
+    "task_update_failed": "failed to update task {task_id}. Task not found.",
+    "no_tasks": "you don't have any tasks assigned yet.",
+    "reminders_sent": "sent reminders to {count} team members.",
+    "transcript_empty": "I couldn't extract useful information from the transcript.",
+}
+
+def _reply(bot, groupId, creatorId, key, **fields):
+    """Send a canned reply addressed to the user who issued the command."""
+    fields["bot_id"] = bot.id
+    bot.sendMessage(
+        groupId,
+        {
+            'text': f"![:Person]({creatorId}), " + _TEMPLATES[key].format_map(fields)
+        }
+    )
+
 # Help message function
+@functools.lru_cache(maxsize=32)
 def helpMsg(botId):
     """Return a help message for the bot."""
     return f'''
@@ -81,227 +246,146 @@ def botGotPostAddAction(bot, groupId, creatorId, user, text, dbAction, handledBy
     if handledByExtension:
         return
 
-    # Check if the message is directed to the bot
-    if f'![:Person]({bot.id})' in text:
-        # Extract the command from the message text
-        command_match = re.search(r'![:Person]\([^)]+\)\s+(\w+)', text)
-        
-        if command_match:
-            command = command_match.group(1).lower()
-            handle_command(bot, groupId, creatorId, command, text, event)
-        else:
-            # No specific command, show help
-            bot.sendMessage(
-                groupId,
-                {
-                    'text': helpMsg(bot.id)
-                }
-            )
-
-def handle_command(bot, groupId, creatorId, command, text, event):
-    """Handle bot commands."""
-    # Get attachments if any
-    attachments = event.get("body", {}).get("body", {}).get("attachments", []) or []
-    
-    if command == "help":
-        bot.sendMessage(
-            groupId,
-            {
-                'text': helpMsg(bot.id)
-            }
-        )
-    
-    elif command == "create-ticket":
-        handle_create_ticket(bot, groupId, creatorId, text, attachments)
-    
-    elif command == "update-ticket":
-        handle_update_ticket(bot, groupId, creatorId, text)
-    
-    elif command == "log-time":
-        handle_log_time(bot, groupId, creatorId, text)
-    
-    elif command == "daily-summary":
-        handle_daily_summary(bot, groupId, creatorId, text)
-    
-    elif command == "meeting-memory":
-        handle_meeting_memory(bot, groupId, creatorId, text)
+    # Check if the message is directed to the bot; plain substring test so
+    # ordinary chatter never reaches the regex engine
+    if f'![:Person]({bot.id})' not in text:
+        return
     
-    elif command == "sprint-health":
-        handle_sprint_health(bot, groupId, creatorId, text)
-        
-    elif command == "add-task":
-        handle_add_task(bot, groupId, creatorId, text)
-        
-    elif command == "update-task":
-        handle_update_task(bot, groupId, creatorId, text)
-        
-    elif command == "my-tasks":
-        handle_my_tasks(bot, groupId, creatorId)
-        
-    elif command == "send-reminders":
-        handle_send_reminders(bot, groupId, creatorId)
+    # Extract the command from the message text
+    command_match = _RE_COMMAND.search(text)
     
+    if command_match:
+        command = command_match.group(1).lower()
+        handle_command(bot, groupId, creatorId, command, text, event)
     else:
-        # Unknown command
+        # No specific command, show help
         bot.sendMessage(
             groupId,
             {
-                'text': f"![:Person]({creatorId}), I don't recognize that command. Type `![:Person]({bot.id}) help` for a list of available commands."
+                'text': helpMsg(bot.id)
             }
         )
 
+def handle_command(bot, groupId, creatorId, command, text, event):
+    """Handle bot commands."""
+    # Get attachments if any
+    attachments = event.get("body", {}).get("body", {}).get("attachments", []) or []
+    
+    handler = _COMMAND_TABLE.get(command)
+    if handler:
+        handler(bot, groupId, creatorId, text, attachments)
+    elif _looks_like_command(command):
+        handle_unknown_command(bot, groupId, creatorId)
+    # Anything else is regular chatter after a mention; don't reply to it
+
 # Command handlers
+def handle_help(bot, groupId, creatorId, text=None, attachments=None):
+    """Handle help command."""
+    bot.sendMessage(
+        groupId,
+        {
+            'text': helpMsg(bot.id)
+        }
+    )
+
+def _looks_like_command(word):
+    """Check whether an unknown word is shaped like a mistyped command."""
+    return 3 <= len(word) <= 24 and word.replace('-', '').isalpha()
+
+def handle_unknown_command(bot, groupId, creatorId):
+    """Reply to a command the bot does not recognize."""
+    _reply(bot, groupId, creatorId, "unknown_command")
+
 def handle_create_ticket(bot, groupId, creatorId, text, attachments):
     """Handle ticket creation command."""
-    from services.jira_service import create_jira_ticket
+    # Parse all ticket fields in one scan of the text
+    params = {m.group(1).lower(): m.group(2).strip() for m in _RE_TICKET_FIELDS.finditer(text)}
     
-    # Parse the command
-    project_match = re.search(r'project\s*:\s*([^,]+)', text, re.IGNORECASE)
-    summary_match = re.search(r'summary\s*:\s*([^,]+)', text, re.IGNORECASE)
-    type_match = re.search(r'type\s*:\s*([^,]+)', text, re.IGNORECASE)
-    priority_match = re.search(r'priority\s*:\s*([^,]+)', text, re.IGNORECASE)
-    desc_match = re.search(r'description\s*:\s*([^,]+)', text, re.IGNORECASE)
-    os_match = re.search(r'os\s*:\s*([^,]+)', text, re.IGNORECASE)
-    
-    if not project_match or not summary_match:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), please provide at least the project and summary to create a ticket."
-            }
-        )
+    if not params.get("project") or not params.get("summary"):
+        _reply(bot, groupId, creatorId, "ticket_missing_fields")
         return
         
     # Extract parameters
-    project = project_match.group(1).strip()
-    summary = summary_match.group(1).strip()
-    issue_type = type_match.group(1).strip() if type_match else "Bug"
-    priority = priority_match.group(1).strip() if priority_match else "Normal"
-    description = desc_match.group(1).strip() if desc_match else ""
-    os = os_match.group(1).strip() if os_match else ""
+    project = params["project"]
+    summary = params["summary"]
+    issue_type = params.get("type", "Bug")
+    priority = params.get("priority", "Normal")
+    description = params.get("description", "")
+    os = params.get("os", "")
     
     # Create the ticket
     access_token = bot.token['access_token']
-    ticket_id = create_jira_ticket(project, summary, os, creatorId, attachments, access_token, description, issue_type, priority)
+    ticket_id = services.create_jira_ticket(project, summary, os, creatorId, attachments, access_token, description, issue_type, priority)
     
     if ticket_id:
         jira_url = f"{JIRA_HOST}/browse/{ticket_id}"
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), a JIRA ticket has been created for the issue: \"{summary}\".\n\n"
-                        f"**Details:**\n"
-                        f"- **Description:** {description}\n"
-                        f"- **Issue Type:** {issue_type}\n"
-                        f"Ticket ID: \"{ticket_id}\". [View Ticket]({jira_url})"
-            }
-        )
+        _reply(bot, groupId, creatorId, "ticket_created", summary=summary, description=description, issue_type=issue_type, ticket_id=ticket_id, jira_url=jira_url)
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), failed to create a JIRA ticket for the issue: \"{summary}\".\n"
-                        f"Please try again later."
-            }
-        )
+        _reply(bot, groupId, creatorId, "ticket_create_failed", summary=summary)
 
-def handle_update_ticket(bot, groupId, creatorId, text):
+def handle_update_ticket(bot, groupId, creatorId, text, attachments=None):
     """Handle ticket update command."""
-    from services.jira_service import update_jira_ticket
-    
     # Parse the command
-    ticket_match = re.search(r'update-ticket\s+(\w+-\d+)', text, re.IGNORECASE)
+    ticket_key = _command_arg(text, "update-ticket")
     
-    if not ticket_match:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), please provide a valid ticket key to update."
-            }
-        )
+    if not _is_ticket_key(ticket_key):
+        _reply(bot, groupId, creatorId, "ticket_key_missing")
         return
-        
-    ticket_key = ticket_match.group(1).strip()
     
     # Extract update parameters
-    status_match = re.search(r'status\s*:\s*([^,]+)', text, re.IGNORECASE)
-    assignee_match = re.search(r'assignee\s*:\s*([^,]+)', text, re.IGNORECASE)
-    points_match = re.search(r'story-points\s*:\s*(\d+)', text, re.IGNORECASE)
-    comment_match = re.search(r'comment\s*:\s*([^,]+)', text, re.IGNORECASE)
+    params = _parse_kv(text)
     
-    status = status_match.group(1).strip() if status_match else None
-    assignee = assignee_match.group(1).strip() if assignee_match else None
-    points = int(points_match.group(1)) if points_match else None
-    comment = comment_match.group(1).strip() if comment_match else None
+    status = params.get("status")
+    assignee = params.get("assignee")
+    points = params.get("story-points")
+    points = int(points) if points and points.isdigit() else None
+    comment = params.get("comment")
     
     # Update the ticket
-    success = update_jira_ticket(ticket_key, status, assignee, points, comment)
+    success = services.update_jira_ticket(ticket_key, status, assignee, points, comment)
     
     if success:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), successfully updated ticket {ticket_key}."
-            }
-        )
+        _reply(bot, groupId, creatorId, "ticket_updated", ticket=ticket_key)
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), failed to update ticket {ticket_key}."
-            }
-        )
+        _reply(bot, groupId, creatorId, "ticket_update_failed", ticket=ticket_key)
 
-def handle_log_time(bot, groupId, creatorId, text):
+def handle_log_time(bot, groupId, creatorId, text, attachments=None):
     """Handle time logging command."""
-    from services.jira_service import log_time_to_jira
-    
     # Parse the command
-    ticket_match = re.search(r'log-time\s+(\w+-\d+)', text, re.IGNORECASE)
-    hours_match = re.search(r'hours\s*:\s*(\d+\.?\d*)', text, re.IGNORECASE)
-    comment_match = re.search(r'comment\s*:\s*([^,]+)', text, re.IGNORECASE)
-    
-    if not ticket_match or not hours_match:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), please provide both ticket key and hours to log time."
-            }
-        )
+    ticket_key = _command_arg(text, "log-time")
+    params = _parse_kv(text)
+    
+    try:
+        hours = float(params["hours"])
+    except (KeyError, ValueError):
+        hours = None
+    # float() also accepts nan, inf and negative values, none of which can be logged
+    if hours is not None and not (math.isfinite(hours) and hours > 0):
+        hours = None
+    
+    if not _is_ticket_key(ticket_key) or hours is None:
+        _reply(bot, groupId, creatorId, "log_time_missing")
         return
         
-    ticket_key = ticket_match.group(1).strip()
-    hours = float(hours_match.group(1))
-    comment = comment_match.group(1).strip() if comment_match else f"Time logged by {user.get('name', 'user')} via ScrumMaster AI"
+    comment = params.get("comment") or f"Time logged by {creatorId} via ScrumMaster AI"
     
     # Log time to JIRA
-    success = log_time_to_jira(ticket_key, hours, comment, creatorId)
+    success = services.log_time_to_jira(ticket_key, hours, comment, creatorId)
     
     if success:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), successfully logged {hours} hours to ticket {ticket_key}."
-            }
-        )
+        _reply(bot, groupId, creatorId, "time_logged", hours=hours, ticket=ticket_key)
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), failed to log time to ticket {ticket_key}."
-            }
-        )
+        _reply(bot, groupId, creatorId, "log_time_failed", ticket=ticket_key)
 
-def handle_daily_summary(bot, groupId, creatorId, text):
+def handle_daily_summary(bot, groupId, creatorId, text, attachments=None):
     """Handle daily summary command."""
-    from services.meeting_service import generate_daily_summary
-    
     # Parse sprint ID if provided
-    sprint_match = re.search(r'sprint\s*:\s*(\d+)', text, re.IGNORECASE)
-    sprint_id = sprint_match.group(1) if sprint_match else None
+    sprint_id = _parse_kv(text).get("sprint")
+    if sprint_id and not sprint_id.isdigit():
+        sprint_id = None
     
     # Generate the summary
-    summary = generate_daily_summary(sprint_id)
+    summary = services.generate_daily_summary(sprint_id)
     
     bot.sendMessage(
         groupId,
@@ -310,16 +394,13 @@ def handle_daily_summary(bot, groupId, creatorId, text):
         }
     )
 
-def handle_meeting_memory(bot, groupId, creatorId, text):
+def handle_meeting_memory(bot, groupId, creatorId, text, attachments=None):
     """Handle meeting memory search command."""
-    from services.meeting_service import search_meeting_memory
-    
     # Parse topic if provided
-    topic_match = re.search(r'topic\s*:\s*([^,]+)', text, re.IGNORECASE)
-    topic = topic_match.group(1).strip() if topic_match else None
+    topic = _parse_kv(text).get("topic")
     
     # Search meeting memory
-    results = search_meeting_memory(topic)
+    results = services.search_meeting_memory(topic)
     
     bot.sendMessage(
         groupId,
@@ -328,24 +409,18 @@ def handle_meeting_memory(bot, groupId, creatorId, text):
         }
     )
 
-def handle_sprint_health(bot, groupId, creatorId, text):
+def handle_sprint_health(bot, groupId, creatorId, text, attachments=None):
     """Handle sprint health command."""
-    from services.jira_service import get_sprint_health
-    
     # Parse sprint ID if provided
-    sprint_match = re.search(r'sprint\s*:\s*(\d+)', text, re.IGNORECASE)
-    sprint_id = sprint_match.group(1) if sprint_match else None
+    sprint_id = _parse_kv(text).get("sprint")
+    if sprint_id and not sprint_id.isdigit():
+        sprint_id = None
     
     # Get sprint health metrics
-    health_metrics = get_sprint_health(sprint_id)
+    health_metrics = services.get_sprint_health(sprint_id)
     
     if "error" in health_metrics:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), error retrieving sprint health: {health_metrics['error']}"
-            }
-        )
+        _reply(bot, groupId, creatorId, "sprint_health_error", error=health_metrics['error'])
     else:
         health_text = f"""
         **Sprint Health: {health_metrics['sprint_name']}**
@@ -369,203 +444,168 @@ def handle_sprint_health(bot, groupId, creatorId, text):
             }
         )
 
-def handle_add_task(bot, groupId, creatorId, text):
+def handle_add_task(bot, groupId, creatorId, text, attachments=None):
     """Handle adding a task for a developer."""
-    from services.reminder_service import track_developer_task
-    
     # Parse the task description
-    desc_match = re.search(r'description\s*:\s*([^,]+)', text, re.IGNORECASE)
-    due_match = re.search(r'due\s*:\s*(\d{4}-\d{2}-\d{2})', text, re.IGNORECASE)
-    jira_match = re.search(r'jira\s*:\s*(\w+-\d+)', text, re.IGNORECASE)
+    params = _parse_kv(text)
     
-    if not desc_match:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), please provide a task description."
-            }
-        )
+    if not params.get("description"):
+        _reply(bot, groupId, creatorId, "task_description_missing")
         return
     
     # Extract parameters
-    description = desc_match.group(1).strip()
-    jira_ticket = jira_match.group(1).strip() if jira_match else None
+    description = params["description"]
+    jira_ticket = params.get("jira")
+    if not _is_ticket_key(jira_ticket):
+        jira_ticket = None
     
     # Parse due date if provided
     due_date = None
-    if due_match:
-        due_date_str = due_match.group(1).strip()
+    due_date_str = params.get("due")
+    if due_date_str:
         try:
             due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
         except ValueError:
-            bot.sendMessage(
-                groupId,
-                {
-                    'text': f"![:Person]({creatorId}), invalid date format. Please use YYYY-MM-DD."
-                }
-            )
+            _reply(bot, groupId, creatorId, "invalid_date")
             return
     
     # Track the task
-    task_id = track_developer_task(creatorId, description, jira_ticket, due_date)
+    task_id = services.track_developer_task(creatorId, description, jira_ticket, due_date)
     
     if task_id:
         due_text = f", due on {due_date.strftime('%Y-%m-%d')}" if due_date else ""
         jira_text = f", linked to JIRA ticket {jira_ticket}" if jira_ticket else ""
         
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), I've added your task: \"{description}\"{due_text}{jira_text}.\n\n"
-                        f"Task ID: {task_id}. You can update it later with `![:Person]({bot.id}) update-task {task_id} status: completed`"
-            }
-        )
+        _reply(bot, groupId, creatorId, "task_added", description=description, due_text=due_text, jira_text=jira_text, task_id=task_id)
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), failed to add your task. Please try again."
-            }
-        )
+        _reply(bot, groupId, creatorId, "task_add_failed")
 
-def handle_update_task(bot, groupId, creatorId, text):
+def handle_update_task(bot, groupId, creatorId, text, attachments=None):
     """Handle updating a task status."""
-    from services.reminder_service import update_task_status
-    
     # Parse the command
-    task_match = re.search(r'update-task\s+(\S+)', text, re.IGNORECASE)
-    status_match = re.search(r'status\s*:\s*([^,]+)', text, re.IGNORECASE)
+    task_id = _command_arg(text, "update-task")
+    status = _parse_kv(text).get("status")
     
-    if not task_match or not status_match:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), please provide both task ID and status.\n"
-                        f"Example: `![:Person]({bot.id}) update-task task-123 status: completed`"
-            }
-        )
+    if not task_id or not status:
+        _reply(bot, groupId, creatorId, "task_update_usage")
         return
     
-    # Extract parameters
-    task_id = task_match.group(1).strip()
-    status = status_match.group(1).strip()
-    
     # Update the task
-    success = update_task_status(task_id, status)
+    success = services.update_task_status(task_id, status)
     
     if success:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), task {task_id} has been updated to status: {status}."
-            }
-        )
+        _reply(bot, groupId, creatorId, "task_updated", task_id=task_id, status=status)
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), failed to update task {task_id}. Task not found."
-            }
-        )
+        _reply(bot, groupId, creatorId, "task_update_failed", task_id=task_id)
 
-def handle_my_tasks(bot, groupId, creatorId):
+def handle_my_tasks(bot, groupId, creatorId, text=None, attachments=None):
     """Handle showing a developer's tasks."""
-    from services.reminder_service import get_developer_tasks
-    
     # Get all tasks for the developer
-    tasks = get_developer_tasks(creatorId)
+    tasks = services.get_developer_tasks(creatorId)
     
     if not tasks:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), you don't have any tasks assigned yet."
-            }
-        )
+        _reply(bot, groupId, creatorId, "no_tasks")
         return
     
-    # Count tasks by status
-    pending_count = sum(1 for t in tasks if t.get("status") == "pending")
-    completed_count = sum(1 for t in tasks if t.get("status") == "completed")
+    # Bucket tasks by status in a single pass
+    pending_tasks = []
+    completed_tasks = []
+    for t in tasks:
+        status = t.get("status")
+        if status == "pending":
+            pending_tasks.append(t)
+        elif status == "completed":
+            completed_tasks.append(t)
+    
+    pending_count = len(pending_tasks)
+    completed_count = len(completed_tasks)
+    fromisoformat = datetime.fromisoformat
+    now = datetime.now()
     
     # Format the response
-    message = f"**Your Tasks ({len(tasks)} total)**\n\n"
-    message += f"**Status Summary:** {pending_count} pending, {completed_count} completed\n\n"
+    parts = [
+        f"**Your Tasks ({len(tasks)} total)**\n\n",
+        f"**Status Summary:** {pending_count} pending, {completed_count} completed\n\n"
+    ]
     
     # Show pending tasks first
     if pending_count > 0:
-        message += "**Pending Tasks:**\n"
-        for task in tasks:
-            if task.get("status") == "pending":
-                created = datetime.fromisoformat(task["created_at"]).strftime("%Y-%m-%d")
-                
-                due_text = ""
-                if task.get("due_date"):
-                    due_date = datetime.fromisoformat(task["due_date"])
-                    now = datetime.now()
-                    
-                    if due_date < now:
-                        days_overdue = (now - due_date).days
-                        due_text = f" (OVERDUE by {days_overdue} days)"
-                    else:
-                        days_left = (due_date - now).days
-                        due_text = f" (Due in {days_left} days)"
-                
-                jira_text = f" [JIRA: {task['jira_ticket']}]" if task.get("jira_ticket") else ""
+        parts.append("**Pending Tasks:**\n")
+        for task in pending_tasks:
+            due = task.get("due_date")
+            jira = task.get("jira_ticket")
+            
+            due_text = ""
+            if due:
+                due_date = fromisoformat(due)
                 
-                message += f"- {task['description']}{due_text}{jira_text} (ID: {task['task_id']})\n"
+                if due_date < now:
+                    days_overdue = (now - due_date).days
+                    due_text = f" (OVERDUE by {days_overdue} days)"
+                else:
+                    days_left = (due_date - now).days
+                    due_text = f" (Due in {days_left} days)"
+            
+            jira_text = f" [JIRA: {jira}]" if jira else ""
+            
+            parts.append(f"- {task['description']}{due_text}{jira_text} (ID: {task['task_id']})\n")
         
-        message += "\n"
+        parts.append("\n")
     
     # Show a few completed tasks (limit to 5 to avoid long messages)
-    completed_tasks = [t for t in tasks if t.get("status") == "completed"]
     if completed_tasks:
-        message += "**Recently Completed Tasks:**\n"
-        for task in completed_tasks[:5]:  # Show only the last 5 completed tasks
-            message += f"- {task['description']} (ID: {task['task_id']})\n"
+        parts.append("**Recently Completed Tasks:**\n")
+        # Show only the last 5 completed tasks
+        parts.extend(f"- {task['description']} (ID: {task['task_id']})\n" for task in completed_tasks[:5])
         
         if len(completed_tasks) > 5:
-            message += f"... and {len(completed_tasks) - 5} more completed tasks\n"
+            parts.append(f"... and {len(completed_tasks) - 5} more completed tasks\n")
     
     bot.sendMessage(
         groupId,
         {
-            'text': message
+            'text': "".join(parts)
         }
     )
 
-def handle_send_reminders(bot, groupId, creatorId):
+def handle_send_reminders(bot, groupId, creatorId, text=None, attachments=None):
     """Handle sending reminders to team members."""
-    from services.reminder_service import send_daily_reminders
-    
     # Only allow admins to trigger reminders
     # In a real implementation, you would check if the user has admin privileges
     # For now, let's assume any user can trigger reminders for demo purposes
     
     # Send reminders
-    results = send_daily_reminders(bot)
+    results = services.send_daily_reminders(bot)
     
-    bot.sendMessage(
-        groupId,
-        {
-            'text': f"![:Person]({creatorId}), sent reminders to {results['reminders_sent']} team members."
-        }
-    )
+    _reply(bot, groupId, creatorId, "reminders_sent", count=results['reminders_sent'])
+
+# Command dispatch table; every handler takes (bot, groupId, creatorId, text, attachments)
+_COMMAND_TABLE = {
+    "help": handle_help,
+    "create-ticket": handle_create_ticket,
+    "update-ticket": handle_update_ticket,
+    "log-time": handle_log_time,
+    "daily-summary": handle_daily_summary,
+    "meeting-memory": handle_meeting_memory,
+    "sprint-health": handle_sprint_health,
+    "add-task": handle_add_task,
+    "update-task": handle_update_task,
+    "my-tasks": handle_my_tasks,
+    "send-reminders": handle_send_reminders,
+}
 
 def process_meeting_transcript(transcript, bot, groupId, creatorId):
     """Process a meeting transcript and extract actionable information."""
-    from services.meeting_service import analyze_transcript, apply_meeting_actions
-    
-    # Analyze the transcript
-    meeting_data = analyze_transcript(transcript)
+    # Analyze, store and apply the transcript in one place so every stored
+    # meeting goes through the same ingest path
+    result = services.process_transcript_content(transcript)
     
-    if meeting_data:
-        # Apply actions extracted from the meeting
-        action_results = apply_meeting_actions(meeting_data)
+    if result:
+        meeting_data = result["meeting_data"]
+        action_results = result["action_results"]
         
-        # Format and send the summary
+        # Format the summary
         summary_text = format_meeting_summary(meeting_data)
-        bot.sendMessage(groupId, {'text': summary_text})
         
         # Report on actions taken
         actions_text = "\n\n**Actions Taken:**\n"
@@ -573,57 +613,46 @@ def process_meeting_transcript(transcript, bot, groupId, creatorId):
         actions_text += f"- Added {len(action_results['blockers_added'])} blockers\n"
         actions_text += f"- Updated {len(action_results['story_points_updated'])} story point estimates\n"
         
-        bot.sendMessage(groupId, {'text': actions_text})
-        
-        # Store the meeting data for future reference
-        meeting_id = str(datetime.now().strftime("%Y%m%d%H%M%S"))
-        meeting_memory[meeting_id] = {
-            "transcript": transcript,
-            "summary": meeting_data,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Send summary and actions in a single post
+        bot.sendMessage(groupId, {'text': summary_text + actions_text})
         
         return True
     else:
-        bot.sendMessage(
-            groupId,
-            {
-                'text': f"![:Person]({creatorId}), I couldn't extract useful information from the transcript."
-            }
-        )
+        _reply(bot, groupId, creatorId, "transcript_empty")
         return False
 
 def format_meeting_summary(data):
     """Format meeting data into a readable summary."""
-    summary = "**Meeting Summary**\n\n"
+    parts = ["**Meeting Summary**\n\n"]
     
     if data.get("action_items"):
-        summary += "**Action Items:**\n"
-        for item in data["action_items"]:
-            summary += f"- {item['task']} → {item['assignee']}\n"
-        summary += "\n"
+        parts.append("**Action Items:**\n")
+        parts.extend(f"- {item['task']} → {item['assignee']}\n" for item in data["action_items"])
+        parts.append("\n")
         
     if data.get("ticket_updates"):
-        summary += "**Ticket Updates:**\n"
-        for update in data["ticket_updates"]:
-            summary += f"- {update['ticket_key']}: {update.get('status', 'discussed')} {update.get('comment', '')}\n"
-        summary += "\n"
+        parts.append("**Ticket Updates:**\n")
+        parts.extend(
+            f"- {update['ticket_key']}: {update.get('status', 'discussed')} {update.get('comment', '')}\n"
+            for update in data["ticket_updates"]
+        )
+        parts.append("\n")
         
     if data.get("story_points"):
-        summary += "**Story Points:**\n"
-        for sp in data["story_points"]:
-            summary += f"- {sp['ticket_key']}: {sp['points']} points\n"
-        summary += "\n"
+        parts.append("**Story Points:**\n")
+        parts.extend(f"- {sp['ticket_key']}: {sp['points']} points\n" for sp in data["story_points"])
+        parts.append("\n")
         
     if data.get("blockers"):
-        summary += "**Blockers:**\n"
-        for blocker in data["blockers"]:
-            summary += f"- {blocker['for_ticket']}: {blocker['description']} (mentioned by {blocker['mentioned_by']})\n"
-        summary += "\n"
+        parts.append("**Blockers:**\n")
+        parts.extend(
+            f"- {blocker['for_ticket']}: {blocker['description']} (mentioned by {blocker['mentioned_by']})\n"
+            for blocker in data["blockers"]
+        )
+        parts.append("\n")
         
     if data.get("decisions"):
-        summary += "**Decisions Made:**\n"
-        for decision in data["decisions"]:
-            summary += f"- {decision['topic']}: {decision['decision']}\n"
+        parts.append("**Decisions Made:**\n")
+        parts.extend(f"- {decision['topic']}: {decision['decision']}\n" for decision in data["decisions"])
             
-    return summary
\ No newline at end of file
+    return "".join(parts)
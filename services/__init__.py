@@ -2,48 +2,77 @@
 Service modules for the ScrumMaster AI bot.
 """
 
-# Import all services for easier access
-from services.jira_service import (
+import importlib
+
+# Service functions exposed for easier access. Each one is resolved on first
+# access (PEP 562), so importing the package does not load every service.
+_LAZY = {
     # Jira service functions
-    get_auth_headers,
-    create_jira_ticket,
-    get_issue,
-    update_jira_ticket,
-    get_transitions,
-    transition_issue,
-    assign_issue,
-    add_comment,
-    log_time_to_jira,
-    get_boards,
-    get_sprints,
-    get_sprint,
-    get_sprint_issues,
-    get_sprint_health
-)
-
-from services.meeting_service import (
+    "get_auth_headers": "services.jira_service",
+    "create_jira_ticket": "services.jira_service",
+    "get_issue": "services.jira_service",
+    "get_issues": "services.jira_service",
+    "update_jira_ticket": "services.jira_service",
+    "get_transitions": "services.jira_service",
+    "transition_issue": "services.jira_service",
+    "invalidate_transitions": "services.jira_service",
+    "assign_issue": "services.jira_service",
+    "add_comment": "services.jira_service",
+    "log_time_to_jira": "services.jira_service",
+    "get_boards": "services.jira_service",
+    "get_sprints": "services.jira_service",
+    "get_sprint": "services.jira_service",
+    "get_sprint_issues": "services.jira_service",
+    "get_sprint_health": "services.jira_service",
+    "close_session": "services.jira_service",
+    "get_boards_async": "services.jira_service",
+    "get_sprints_async": "services.jira_service",
+    "get_sprint_async": "services.jira_service",
+    "get_sprint_issues_async": "services.jira_service",
+    "get_sprint_health_async": "services.jira_service",
+
     # Meeting service functions
-    analyze_transcript,
-    apply_meeting_actions,
-    search_meeting_memory,
-    generate_daily_summary,
-    get_meeting_history_for_ticket,
-    extract_action_items_from_text,
-    parse_transcript_file,
-    process_transcript_content,
-    get_recent_meetings
-)
-
-from services.reminder_service import (
+    "analyze_transcript": "services.meeting_service",
+    "apply_meeting_actions": "services.meeting_service",
+    "search_meeting_memory": "services.meeting_service",
+    "generate_daily_summary": "services.meeting_service",
+    "get_meeting_history_for_ticket": "services.meeting_service",
+    "extract_action_items_from_text": "services.meeting_service",
+    "parse_transcript_file": "services.meeting_service",
+    "process_transcript_content": "services.meeting_service",
+    "get_recent_meetings": "services.meeting_service",
+    "analyze_transcript_async": "services.meeting_service",
+    "search_meeting_memory_async": "services.meeting_service",
+    "find_topic_mentions": "services.meeting_service",
+    "extract_action_items_from_text_async": "services.meeting_service",
+    "process_transcripts_async": "services.meeting_service",
+    "bulk_analyze_transcripts": "services.meeting_service",
+    "close_openai_session": "services.meeting_service",
+
     # Reminder service functions
-    track_developer_task,
-    update_task_status,
-    get_developer_tasks,
-    get_pending_tasks,
-    get_overdue_tasks,
-    send_daily_reminders,
-    format_reminder_message,
-    sync_tasks_with_jira,
-    check_inactive_tickets,
-    send_overdue_reminders
-)
\ No newline at end of file
+    "track_developer_task": "services.reminder_service",
+    "update_task_status": "services.reminder_service",
+    "get_developer_tasks": "services.reminder_service",
+    "get_pending_tasks": "services.reminder_service",
+    "get_overdue_tasks": "services.reminder_service",
+    "send_daily_reminders": "services.reminder_service",
+    "format_reminder_message": "services.reminder_service",
+    "sync_tasks_with_jira": "services.reminder_service",
+    "check_inactive_tickets": "services.reminder_service",
+    "send_overdue_reminders": "services.reminder_service",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    """Import the owning service module the first time a function is accessed."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,12 +2,23 @@
 Service for interacting with JIRA API using direct REST calls.
 """
 
-import os
-import json
-import requests
 import logging
+import time
+import atexit
+import bisect
+import asyncio
+import tempfile
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from config import JIRA_HOST, JIRA_PAT, JIRA_STORY_POINTS_FIELD
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to requests' own decoder
+    orjson = None
+from config import JIRA_HOST, JIRA_PAT, JIRA_STORY_POINTS_FIELD, get_jira_session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,17 +27,154 @@ logger = logging.getLogger(__name__)
 # Base URL for JIRA REST API
 BASE_API_URL = f"{JIRA_HOST}/rest/api/2"
 
+def _json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Authentication headers, built once; the pooled session sends them by default
+_AUTH_HEADERS = {
+    "Authorization": f"Bearer {JIRA_PAT}",
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# Per-request overrides for multipart attachment uploads
+_ATTACH_HEADERS = {
+    "X-Atlassian-Token": "no-check",  # Required for file uploads
+    "Content-Type": None  # Drop the session default so requests sets multipart
+}
+
 def get_auth_headers():
     """Get authentication headers for JIRA API."""
-    return {
-        "Authorization": f"Bearer {JIRA_PAT}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    return dict(_AUTH_HEADERS)
+
+# Pooled session shared by every JIRA call; auth headers are sent by default
+_session = get_jira_session()
+_session.headers.update(_AUTH_HEADERS)
+
+# Upper bound on concurrent requests issued by a single call
+_MAX_WORKERS = 8
+
+# Attachments are streamed in 1 MiB chunks and kept in memory up to 8 MiB
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+def _ttl_cache(maxsize=256, ttl=300):
+    """Memoize a lookup for `ttl` seconds, keeping at most `maxsize` entries.
+
+    Empty results are not cached, since the helpers return them on errors.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+                if entry and entry[0] > now:
+                    cache.move_to_end(key)
+                    return entry[1]
+
+            value = func(*args, **kwargs)
+            if value:
+                with lock:
+                    cache[key] = (now + ttl, value)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return value
+
+        def cache_evict(predicate):
+            """Drop every entry whose positional args satisfy `predicate`."""
+            with lock:
+                for key in [k for k in cache if predicate(k[0])]:
+                    del cache[key]
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_peek(*args, **kwargs):
+            """Return the cached value for these arguments if still fresh, without calling through."""
+            key = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                entry = cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+            return None
+
+        wrapper.cache_evict = cache_evict
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_peek = cache_peek
+        return wrapper
+    return decorator
+
+# Background workers that copy attachments after a ticket has been created
+_ATTACH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jira-attach")
+
+def close_session():
+    """Finish pending attachment copies and close pooled JIRA connections, e.g. on shutdown."""
+    _ATTACH_POOL.shutdown(wait=True)
+    _session.close()
+
+atexit.register(close_session)
+
+def _copy_attachment(issue_key, attachment, access_token=None):
+    """Download a chat attachment and upload it to a JIRA issue."""
+    file_name = attachment['name']
+    file_url = attachment['contentUri']
+    
+    try:
+        # Never forward the JIRA token to the attachment host
+        headers = {"Authorization": f"Bearer {access_token}" if access_token else None}
+        
+        # Download the file
+        response = _session.get(file_url, headers=headers, stream=True)
+        
+        # Close the streamed download on every path so its connection goes back to the pool
+        with response:
+            if response.status_code != 200:
+                logger.error(f"Failed to download attachment from {file_url}")
+                return False
+                
+            # Stream into a spooled buffer: small files stay in memory, large ones spill to disk
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                f.seek(0)
+                
+                # Attach the file to the issue
+                attach_url = f"{BASE_API_URL}/issue/{issue_key}/attachments"
+                files = {'file': (file_name, f)}
+                attach_response = _session.post(attach_url, headers=_ATTACH_HEADERS, files=files)
+            
+        if attach_response.status_code not in [200, 201]:
+            logger.error(f"Failed to attach file: {attach_response.status_code} - {attach_response.text}")
+            return False
+            
+        logger.info(f"Attachment '{file_name}' uploaded successfully.")
+        return True
+            
+    except Exception as e:
+        logger.error(f"Failed to copy attachment '{file_name}' to {issue_key}: {str(e)}")
+        return False
+
+def _forget_issue(issue_key):
+    """Drop an issue from the read cache after it has been modified."""
+    get_issue.cache_evict(lambda args: args[0] == issue_key)
 
 def create_jira_ticket(project, summary, os="", reporter_id=None, attachments=None, 
-                     access_token=None, description="", issue_type="Bug", priority="Normal"):
-    """Create a new JIRA ticket with the provided details."""
+                     access_token=None, description="", issue_type="Bug", priority="Normal",
+                     wait_for_attachments=False):
+    """Create a new JIRA ticket with the provided details.
+
+    Attachments are copied in the background unless `wait_for_attachments` is set.
+    """
     if not attachments:
         attachments = []
         
@@ -45,10 +193,9 @@ def create_jira_ticket(project, summary, os="", reporter_id=None, attachments=No
         
         # Make the API call to create the issue
         url = f"{BASE_API_URL}/issue"
-        response = requests.post(
-            url, 
-            headers=get_auth_headers(),
-            data=json.dumps(issue_data)
+        response = _session.post(
+            url,
+            json=issue_data
         )
         
         if response.status_code not in [200, 201]:
@@ -56,46 +203,16 @@ def create_jira_ticket(project, summary, os="", reporter_id=None, attachments=No
             return None
             
         # Get the issue key from the response
-        issue_data = response.json()
+        issue_data = _json(response)
         issue_key = issue_data.get("key")
         logger.info(f"Issue created successfully: {issue_key}")
         
-        # Process attachments if any
-        for attachment in attachments:
-            file_name = attachment['name']
-            file_url = attachment['contentUri']
-            
-            headers = {}
-            if access_token:
-                headers["Authorization"] = f"Bearer {access_token}"
-            
-            # Download the file
-            response = requests.get(file_url, headers=headers, stream=True)
-            if response.status_code == 200:
-                # Save the file temporarily
-                temp_file_path = os.path.join("/tmp", file_name)
-                with open(temp_file_path, 'wb') as f:
-                    f.write(response.content)
-                    
-                # Attach the file to the issue
-                attach_url = f"{BASE_API_URL}/issue/{issue_key}/attachments"
-                attach_headers = get_auth_headers()
-                attach_headers["X-Atlassian-Token"] = "no-check"  # Required for file uploads
-                attach_headers.pop("Content-Type", None)  # Remove content-type for multipart
-                
-                with open(temp_file_path, 'rb') as f:
-                    files = {'file': (file_name, f)}
-                    attach_response = requests.post(attach_url, headers=attach_headers, files=files)
-                    
-                    if attach_response.status_code not in [200, 201]:
-                        logger.error(f"Failed to attach file: {attach_response.status_code} - {attach_response.text}")
-                    else:
-                        logger.info(f"Attachment '{file_name}' uploaded successfully.")
-                
-                # Clean up
-                os.remove(temp_file_path)
-            else:
-                logger.error(f"Failed to download attachment from {file_url}")
+        # Process attachments if any; the issue key is already usable, so they
+        # are copied concurrently in the background
+        futures = [_ATTACH_POOL.submit(_copy_attachment, issue_key, a, access_token) for a in attachments]
+        if wait_for_attachments:
+            for future in futures:
+                future.result()
         
         return issue_key
         
@@ -103,17 +220,18 @@ def create_jira_ticket(project, summary, os="", reporter_id=None, attachments=No
         logger.error(f"Failed to create issue: {str(e)}")
         return None
 
+@_ttl_cache(maxsize=1024, ttl=30)
 def get_issue(issue_key):
     """Get details of a JIRA issue."""
     try:
         url = f"{BASE_API_URL}/issue/{issue_key}"
-        response = requests.get(url, headers=get_auth_headers())
+        response = _session.get(url)
         
         if response.status_code != 200:
             logger.error(f"Failed to get issue {issue_key}: {response.status_code} - {response.text}")
             return None
             
-        return response.json()
+        return _json(response)
         
     except Exception as e:
         logger.error(f"Error getting issue {issue_key}: {str(e)}")
@@ -122,107 +240,109 @@ def get_issue(issue_key):
 def update_jira_ticket(ticket_key, status=None, assignee=None, story_points=None, comment=None):
     """Update a JIRA ticket with the provided details."""
     try:
-        # First get the current issue to check if it exists
-        issue = get_issue(ticket_key)
-        if not issue:
-            return False
-            
-        # Prepare the update data
+        # Fields, assignee and comment all go in one edit request; a missing
+        # issue is reported by its 404 instead of a separate existence check
         update_data = {"fields": {}}
         
         # Update story points if provided
         if story_points is not None:
             update_data["fields"][JIRA_STORY_POINTS_FIELD] = float(story_points)
             
+        # Update assignee if provided
+        if assignee:
+            update_data["fields"]["assignee"] = {"name": assignee}
+            
+        # Add comment if provided
+        if comment:
+            update_data["update"] = {"comment": [{"add": {"body": comment}}]}
+            
         # Make the API call to update the issue
-        if update_data["fields"]:
+        if update_data["fields"] or "update" in update_data:
             url = f"{BASE_API_URL}/issue/{ticket_key}"
-            response = requests.put(
+            response = _session.put(
                 url,
-                headers=get_auth_headers(),
-                data=json.dumps(update_data)
+                json=update_data
             )
             
             if response.status_code not in [200, 204]:
                 logger.error(f"Failed to update issue {ticket_key}: {response.status_code} - {response.text}")
                 return False
+            _forget_issue(ticket_key)
         
-        # Update status if provided
+        # Update status if provided; the edit endpoint cannot change status
         if status:
             success = transition_issue(ticket_key, status)
             if not success:
                 return False
                 
-        # Update assignee if provided
-        if assignee:
-            success = assign_issue(ticket_key, assignee)
-            if not success:
-                return False
-                
-        # Add comment if provided
-        if comment:
-            success = add_comment(ticket_key, comment)
-            if not success:
-                return False
-                
         return True
         
     except Exception as e:
         logger.error(f"Failed to update ticket {ticket_key}: {str(e)}")
         return False
 
+@_ttl_cache()
 def get_transitions(issue_key):
     """Get available transitions for an issue."""
     try:
         url = f"{BASE_API_URL}/issue/{issue_key}/transitions"
-        response = requests.get(url, headers=get_auth_headers())
+        response = _session.get(url)
         
         if response.status_code != 200:
             logger.error(f"Failed to get transitions for {issue_key}: {response.status_code} - {response.text}")
             return []
             
-        data = response.json()
+        data = _json(response)
         return data.get("transitions", [])
         
     except Exception as e:
         logger.error(f"Error getting transitions for {issue_key}: {str(e)}")
         return []
 
+@_ttl_cache()
+def _transition_ids(issue_key):
+    """Map lowercased transition names to their ids for an issue."""
+    return {t['name'].lower(): t['id'] for t in get_transitions(issue_key)}
+
+def _forget_transitions(predicate):
+    get_transitions.cache_evict(predicate)
+    _transition_ids.cache_evict(predicate)
+
+def invalidate_transitions(project_key):
+    """Clear cached transitions for a project, e.g. after a workflow edit."""
+    prefix = f"{project_key}-"
+    _forget_transitions(lambda args: str(args[0]).startswith(prefix))
+
+def _post_transition(issue_key, transition_id):
+    url = f"{BASE_API_URL}/issue/{issue_key}/transitions"
+    data = {
+        "transition": {
+            "id": transition_id
+        }
+    }
+    return _session.post(url, json=data)
+
 def transition_issue(issue_key, target_status):
     """Move a JIRA issue to the specified status."""
     try:
-        # Get available transitions
-        transitions = get_transitions(issue_key)
-        
-        # Find the transition that matches the target status
-        transition_id = None
-        for t in transitions:
-            if t['name'].lower() == target_status.lower():
-                transition_id = t['id']
-                break
-                
+        # Find the transition that matches the target status; ids belong to the
+        # issue's workflow, so they are always read from the issue's own list
+        transition_id = _transition_ids(issue_key).get(target_status.lower())
+        
         if not transition_id:
             logger.warning(f"No transition found for status: {target_status}")
             return False
             
         # Make the API call to transition the issue
-        url = f"{BASE_API_URL}/issue/{issue_key}/transitions"
-        data = {
-            "transition": {
-                "id": transition_id
-            }
-        }
-        
-        response = requests.post(
-            url,
-            headers=get_auth_headers(),
-            data=json.dumps(data)
-        )
+        response = _post_transition(issue_key, transition_id)
         
         if response.status_code not in [200, 204]:
             logger.error(f"Failed to transition issue {issue_key}: {response.status_code} - {response.text}")
             return False
             
+        # The issue's available transitions depend on its new status
+        _forget_transitions(lambda args: args[0] == issue_key)
+        _forget_issue(issue_key)
         logger.info(f"Issue {issue_key} transitioned to {target_status}")
         return True
         
@@ -238,16 +358,16 @@ def assign_issue(issue_key, assignee):
             "name": assignee
         }
         
-        response = requests.put(
+        response = _session.put(
             url,
-            headers=get_auth_headers(),
-            data=json.dumps(data)
+            json=data
         )
         
         if response.status_code not in [200, 204]:
             logger.error(f"Failed to assign issue {issue_key}: {response.status_code} - {response.text}")
             return False
             
+        _forget_issue(issue_key)
         logger.info(f"Issue {issue_key} assigned to {assignee}")
         return True
         
@@ -263,16 +383,16 @@ def add_comment(issue_key, comment_text):
             "body": comment_text
         }
         
-        response = requests.post(
+        response = _session.post(
             url,
-            headers=get_auth_headers(),
-            data=json.dumps(data)
+            json=data
         )
         
         if response.status_code not in [200, 201]:
             logger.error(f"Failed to add comment to {issue_key}: {response.status_code} - {response.text}")
             return False
             
+        _forget_issue(issue_key)
         logger.info(f"Comment added to issue {issue_key}")
         return True
         
@@ -283,12 +403,7 @@ def add_comment(issue_key, comment_text):
 def log_time_to_jira(ticket_key, hours, comment=None, developer_id=None):
     """Log time on a JIRA ticket."""
     try:
-        # First check if the issue exists
-        issue = get_issue(ticket_key)
-        if not issue:
-            return False
-            
-        # Convert hours to seconds
+        # Convert hours to seconds; a missing issue is reported by the POST's 404
         seconds = int(float(hours) * 3600)
         
         # Prepare worklog data
@@ -299,16 +414,16 @@ def log_time_to_jira(ticket_key, hours, comment=None, developer_id=None):
         }
         
         # Make the API call to add worklog
-        response = requests.post(
+        response = _session.post(
             url,
-            headers=get_auth_headers(),
-            data=json.dumps(data)
+            json=data
         )
         
         if response.status_code not in [200, 201]:
             logger.error(f"Failed to log time on {ticket_key}: {response.status_code} - {response.text}")
             return False
             
+        _forget_issue(ticket_key)
         logger.info(f"Successfully logged {hours} hours to {ticket_key}")
         return True
         
@@ -316,23 +431,25 @@ def log_time_to_jira(ticket_key, hours, comment=None, developer_id=None):
         logger.error(f"Failed to log time on {ticket_key}: {str(e)}")
         return False
 
+@_ttl_cache()
 def get_boards():
     """Get all boards."""
     try:
         url = f"{JIRA_HOST}/rest/agile/1.0/board"
-        response = requests.get(url, headers=get_auth_headers())
+        response = _session.get(url)
         
         if response.status_code != 200:
             logger.error(f"Failed to get boards: {response.status_code} - {response.text}")
             return []
             
-        data = response.json()
+        data = _json(response)
         return data.get("values", [])
         
     except Exception as e:
         logger.error(f"Error getting boards: {str(e)}")
         return []
 
+@_ttl_cache()
 def get_sprints(board_id, state="active"):
     """Get sprints for a board."""
     try:
@@ -340,52 +457,189 @@ def get_sprints(board_id, state="active"):
         if state:
             url += f"?state={state}"
             
-        response = requests.get(url, headers=get_auth_headers())
+        response = _session.get(url)
         
         if response.status_code != 200:
             logger.error(f"Failed to get sprints for board {board_id}: {response.status_code} - {response.text}")
             return []
             
-        data = response.json()
+        data = _json(response)
         return data.get("values", [])
         
     except Exception as e:
         logger.error(f"Error getting sprints for board {board_id}: {str(e)}")
         return []
 
+@_ttl_cache()
 def get_sprint(sprint_id):
     """Get sprint details."""
     try:
         url = f"{JIRA_HOST}/rest/agile/1.0/sprint/{sprint_id}"
-        response = requests.get(url, headers=get_auth_headers())
+        response = _session.get(url)
         
         if response.status_code != 200:
             logger.error(f"Failed to get sprint {sprint_id}: {response.status_code} - {response.text}")
             return None
             
-        return response.json()
+        return _json(response)
         
     except Exception as e:
         logger.error(f"Error getting sprint {sprint_id}: {str(e)}")
         return None
 
-def get_sprint_issues(sprint_id):
-    """Get issues in a sprint."""
-    try:
-        url = f"{JIRA_HOST}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        response = requests.get(url, headers=get_auth_headers())
+def _iter_search(jql, fields=None, batch_size=100, **extra_params):
+    """Yield the issues matching a JQL query one page at a time, raising on a failed page."""
+    url = f"{BASE_API_URL}/search"
+    params = {"jql": jql, "maxResults": batch_size, "startAt": 0, **extra_params}
+    if fields:
+        params["fields"] = ",".join(fields)
+        
+    # Page through the results until every issue has been fetched
+    while True:
+        response = _session.get(url, params=params)
         
         if response.status_code != 200:
-            logger.error(f"Failed to get issues for sprint {sprint_id}: {response.status_code} - {response.text}")
-            return []
+            # The error body is only logged; the message may be shown in chat
+            logger.error(f"JIRA search failed for '{jql}': {response.status_code} - {response.text}")
+            raise RuntimeError(f"JIRA search failed ({response.status_code})")
+            
+        data = _json(response)
+        page = data.get("issues", [])
+        yield from page
+        
+        params["startAt"] += len(page)
+        if not page or params["startAt"] >= data.get("total", 0):
+            return
+
+def _iter_sprint_issues(sprint_id, fields=None, batch_size=100):
+    """Yield a sprint's issues one page at a time, raising on a failed page."""
+    return _iter_search(f"sprint = {sprint_id}", fields, batch_size)
+
+def get_issues(issue_keys, fields=None, batch_size=100):
+    """Get several JIRA issues, keyed by issue key, in one search per `batch_size` keys.
+
+    Issues still in get_issue's cache are reused. Keys that do not exist are
+    left out, as are the keys of a batch whose search fails.
+    """
+    issues = {}
+    missing = []
+    for key in dict.fromkeys(issue_keys):
+        cached = get_issue.cache_peek(key)
+        if cached:
+            issues[key] = cached
+        else:
+            missing.append(key)
+            
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        jql = "key in ({})".format(",".join(f'"{key}"' for key in batch))
+        try:
+            # validateQuery=warn skips unknown keys instead of failing the whole batch
+            for issue in _iter_search(jql, fields, batch_size, validateQuery="warn"):
+                issues[issue["key"]] = issue
+                
+        except Exception as e:
+            logger.error(f"Error getting issues {', '.join(batch)}: {str(e)}")
             
-        data = response.json()
-        return data.get("issues", [])
+    return issues
+
+def get_sprint_issues(sprint_id, fields=None, batch_size=100):
+    """Get issues in a sprint, optionally limited to the given fields."""
+    try:
+        return list(_iter_sprint_issues(sprint_id, fields, batch_size))
         
     except Exception as e:
         logger.error(f"Error getting issues for sprint {sprint_id}: {str(e)}")
         return []
 
+# Issue fields read by the sprint health metrics
+_HEALTH_FIELDS = ("status", JIRA_STORY_POINTS_FIELD)
+
+# Lowercased status names that count as completed work
+_DONE_STATES = frozenset(("done", "closed"))
+
+# Progress ratios below each threshold get the matching health label
+_HEALTH_THRESHOLDS = (0.5, 0.8)
+_HEALTH_LABELS = ("Critical", "At Risk", "On Track")
+
+def _parse_jira_datetime(value):
+    """Parse a JIRA ISO timestamp, accepting a trailing 'Z' on any Python 3."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _sprint_health_metrics(sprint, issues):
+    """Compute health metrics for a sprint from an iterable of its issues."""
+    # Count issues and story points in a single pass
+    total_issues = 0
+    completed_issues = 0
+    total_points = 0
+    completed_points = 0
+    
+    # Bind the loop invariants to locals
+    points_field = JIRA_STORY_POINTS_FIELD
+    done_states = _DONE_STATES
+    
+    for issue in issues:
+        total_issues += 1
+        fields = issue.get("fields")
+        if not fields:
+            continue
+            
+        # Get story points (custom field)
+        story_points = fields.get(points_field) or 0
+        total_points += story_points
+        
+        status = fields.get("status")
+        if status and status.get("name", "").lower() in done_states:
+            completed_issues += 1
+            completed_points += story_points
+    
+    # Calculate sprint dates
+    start_date = sprint.get("startDate")
+    end_date = sprint.get("endDate")
+    
+    if start_date and end_date:
+        start_date_obj = _parse_jira_datetime(start_date)
+        end_date_obj = _parse_jira_datetime(end_date)
+        now = datetime.now(start_date_obj.tzinfo)
+        
+        total_seconds = (end_date_obj - start_date_obj).total_seconds()
+        elapsed_seconds = (now - start_date_obj).total_seconds()
+        elapsed_days = int(elapsed_seconds // 86400)
+        remaining_days = max(0, (end_date_obj - now).days)
+        
+        # Ideal burndown vs actual, at sub-day precision so it doesn't jump at midnight
+        ideal_completion_rate = elapsed_seconds / total_seconds if total_seconds > 0 else 0
+        actual_completion_rate = completed_points / total_points if total_points > 0 else 0
+        
+        # Health status from the actual/ideal progress ratio
+        ratio = actual_completion_rate / ideal_completion_rate if ideal_completion_rate > 0 else 1.0
+        health_status = _HEALTH_LABELS[bisect.bisect_right(_HEALTH_THRESHOLDS, ratio)]
+    else:
+        elapsed_days = 0
+        remaining_days = 0
+        ideal_completion_rate = 0
+        actual_completion_rate = 0
+        health_status = "Unknown"
+    
+    # Assemble the response
+    return {
+        "sprint_name": sprint.get("name", "Unknown"),
+        "start_date": start_date or "Unknown",
+        "end_date": end_date or "Unknown",
+        "total_issues": total_issues,
+        "completed_issues": completed_issues,
+        "total_points": total_points,
+        "completed_points": completed_points,
+        "completion_percentage": round(completed_points / total_points * 100 if total_points > 0 else 0, 1),
+        "days_elapsed": elapsed_days,
+        "days_remaining": remaining_days,
+        "ideal_completion_percentage": round(ideal_completion_rate * 100, 1),
+        "actual_completion_percentage": round(actual_completion_rate * 100, 1),
+        "health_status": health_status
+    }
+
 def get_sprint_health(sprint_id=None):
     """Get sprint health metrics."""
     try:
@@ -394,10 +648,11 @@ def get_sprint_health(sprint_id=None):
             boards = get_boards()
             active_sprints = []
             
-            for board in boards:
-                board_id = board.get("id")
-                sprints = get_sprints(board_id, state="active")
-                active_sprints.extend(sprints)
+            # Boards are independent, so overlap their sprint lookups
+            if boards:
+                with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(boards))) as executor:
+                    sprint_lists = executor.map(lambda b: get_sprints(b.get("id"), state="active"), boards)
+                    active_sprints = list(itertools.chain.from_iterable(sprint_lists))
             
             if not active_sprints:
                 return {"error": "No active sprints found"}
@@ -409,74 +664,53 @@ def get_sprint_health(sprint_id=None):
             if not sprint:
                 return {"error": f"Sprint {sprint_id} not found"}
         
-        # Get sprint issues
-        issues = get_sprint_issues(sprint_id)
-        
-        # Calculate metrics
-        total_issues = len(issues)
-        completed_issues = sum(1 for i in issues if i.get("fields", {}).get("status", {}).get("name", "").lower() in ('done', 'closed'))
+        # Stream sprint issues page by page, fetching only the fields the metrics use
+        issues = _iter_sprint_issues(sprint_id, fields=_HEALTH_FIELDS)
         
-        # Calculate story points
-        total_points = 0
-        completed_points = 0
+        return _sprint_health_metrics(sprint, issues)
         
-        for issue in issues:
-            # Get story points (custom field)
-            fields = issue.get("fields", {})
-            story_points = fields.get(JIRA_STORY_POINTS_FIELD, 0) or 0
-            total_points += story_points
-            
-            if fields.get("status", {}).get("name", "").lower() in ('done', 'closed'):
-                completed_points += story_points
-        
-        # Calculate sprint dates
-        start_date = sprint.get("startDate")
-        end_date = sprint.get("endDate")
-        
-        if start_date and end_date:
-            start_date_obj = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            end_date_obj = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-            now = datetime.now(start_date_obj.tzinfo)
-            
-            total_days = (end_date_obj - start_date_obj).days
-            elapsed_days = (now - start_date_obj).days
-            remaining_days = max(0, (end_date_obj - now).days)
-            
-            # Ideal burndown vs actual
-            ideal_completion_rate = elapsed_days / total_days if total_days > 0 else 0
-            actual_completion_rate = completed_points / total_points if total_points > 0 else 0
+    except Exception as e:
+        logger.error(f"Failed to get sprint health: {str(e)}")
+        return {"error": str(e)}
+
+async def get_boards_async():
+    """Async variant of get_boards that does not block the event loop."""
+    return await asyncio.to_thread(get_boards)
+
+async def get_sprints_async(board_id, state="active"):
+    """Async variant of get_sprints that does not block the event loop."""
+    return await asyncio.to_thread(get_sprints, board_id, state)
+
+async def get_sprint_async(sprint_id):
+    """Async variant of get_sprint that does not block the event loop."""
+    return await asyncio.to_thread(get_sprint, sprint_id)
+
+async def get_sprint_issues_async(sprint_id, fields=None, batch_size=100):
+    """Async variant of get_sprint_issues that does not block the event loop."""
+    return await asyncio.to_thread(get_sprint_issues, sprint_id, fields, batch_size)
+
+async def get_sprint_health_async(sprint_id=None):
+    """Async variant of get_sprint_health with concurrent REST calls."""
+    try:
+        # If no sprint ID is provided, get the active sprint
+        if not sprint_id:
+            boards = await get_boards_async()
+            sprint_lists = await asyncio.gather(*(get_sprints_async(b.get("id"), "active") for b in boards))
+            active_sprints = list(itertools.chain.from_iterable(sprint_lists))
             
-            # Health status
-            health_status = "On Track"
-            if actual_completion_rate < ideal_completion_rate * 0.8:
-                health_status = "At Risk"
-            elif actual_completion_rate < ideal_completion_rate * 0.5:
-                health_status = "Critical"
+            if not active_sprints:
+                return {"error": "No active sprints found"}
+                
+            sprint = active_sprints[0]
+            issues = await get_sprint_issues_async(sprint.get("id"), fields=_HEALTH_FIELDS)
         else:
-            total_days = 0
-            elapsed_days = 0
-            remaining_days = 0
-            ideal_completion_rate = 0
-            actual_completion_rate = 0
-            health_status = "Unknown"
-        
-        # Assemble the response
-        return {
-            "sprint_name": sprint.get("name", "Unknown"),
-            "start_date": start_date or "Unknown",
-            "end_date": end_date or "Unknown",
-            "total_issues": total_issues,
-            "completed_issues": completed_issues,
-            "total_points": total_points,
-            "completed_points": completed_points,
-            "completion_percentage": round(completed_points / total_points * 100 if total_points > 0 else 0, 1),
-            "days_elapsed": elapsed_days,
-            "days_remaining": remaining_days,
-            "ideal_completion_percentage": round(ideal_completion_rate * 100, 1),
-            "actual_completion_percentage": round(actual_completion_rate * 100, 1),
-            "health_status": health_status
-        }
+            # The sprint and its issues are independent lookups
+            sprint, issues = await asyncio.gather(get_sprint_async(sprint_id), get_sprint_issues_async(sprint_id, fields=_HEALTH_FIELDS))
+            if not sprint:
+                return {"error": f"Sprint {sprint_id} not found"}
+        
+        return _sprint_health_metrics(sprint, issues)
         
     except Exception as e:
         logger.error(f"Failed to get sprint health: {str(e)}")
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
@@ -4,26 +4,149 @@ Service for processing meeting transcripts and managing meeting data.
 
 import os
 import json
+import math
+import mmap
+import time
+import heapq
+import operator
+import asyncio
+import hashlib
 import logging
+import functools
+import threading
+import weakref
+import aiohttp
 import openai
+from tenacity import (
+    retry, wait_random_exponential, stop_after_attempt,
+    retry_if_exception_type, before_sleep_log
+)
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from config import meeting_memory, JIRA_HOST
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+try:
+    import tiktoken
+except ImportError:  # optional; token counts are estimated without it
+    tiktoken = None
+from config import meeting_memory, new_meeting_id, remember_meeting, MAX_MEETINGS, JIRA_HOST, get_openai_session
 from services.jira_service import update_jira_ticket, get_issue
+from services.search_index import index_meeting, search_meetings, remove_meetings
+from services.meeting_store import (
+    store_meeting, get_meeting, recent_meeting_ids, find_meeting_by_hash, prune_meetings
+)
 
 # Configure OpenAI
 openai.api_key = os.environ.get('OPENAI_API_KEY')
 
+# Model used for structured extraction; it supports JSON mode, which
+# guarantees parseable output and avoids retries on malformed responses
+EXTRACTION_MODEL = "gpt-4o-mini"
+_JSON_RESPONSE = {"type": "json_object"}
+
+# Model used to embed transcripts and topics for the topic-search prefilter
+EMBEDDING_MODEL = "text-embedding-3-small"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def analyze_transcript(transcript):
-    """Process a meeting transcript and extract structured data."""
-    if not openai.api_key:
-        logger.warning("OpenAI API key not set, using mock data")
-        return mock_meeting_data()
-        
-    prompt = f"""
+# JSON helpers that use orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_dumps(obj):
+    """Serialize to a JSON string, using orjson when it is installed."""
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+def _json_dumps_sorted(obj):
+    """Serialize with sorted keys, as a canonical form for comparing values."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True)
+
+# Transient OpenAI failures are retried with jittered exponential backoff;
+# bad requests (malformed prompt, context too long) still fail immediately.
+# openai.error only exists in the 0.x SDK this module targets, so the types are
+# looked up defensively and an incompatible install never breaks the import
+_openai_error = getattr(openai, "error", None)
+_RETRYABLE_OPENAI_ERRORS = tuple(
+    getattr(_openai_error, name)
+    for name in ("RateLimitError", "Timeout", "APIConnectionError", "ServiceUnavailableError")
+    if hasattr(_openai_error, name)
+)
+
+_openai_retry = retry(
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception_type(_RETRYABLE_OPENAI_ERRORS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+@_openai_retry
+def _chat_completion(**kwargs):
+    return openai.ChatCompletion.create(**kwargs)
+
+@_openai_retry
+def _embedding_create(**kwargs):
+    return openai.Embedding.create(**kwargs)
+
+# One pooled aiohttp session per event loop for async OpenAI calls; without
+# it the SDK opens a new session (and TLS connection) for every request
+_aiosessions = weakref.WeakKeyDictionary()
+
+def _use_pooled_aiosession():
+    loop = asyncio.get_running_loop()
+    session = _aiosessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300))
+        _aiosessions[loop] = session
+    aiosession = getattr(openai, "aiosession", None)  # 0.x SDK only
+    if aiosession is not None:
+        aiosession.set(session)
+
+async def close_openai_session():
+    """Close the pooled OpenAI session of the running event loop, e.g. before it shuts down."""
+    session = _aiosessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+@_openai_retry
+async def _chat_completion_async(**kwargs):
+    _use_pooled_aiosession()
+    return await openai.ChatCompletion.acreate(**kwargs)
+
+# Raw model output of recent transcript analyses, keyed by transcript SHA-256,
+# so re-uploaded transcripts skip the GPT-4 call
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+_MAX_CACHED_ANALYSES = 128
+
+# Transcripts longer than this many tokens are analyzed in chunks
+_MAX_CHUNK_TOKENS = 6000
+
+# List sections of an analysis that are concatenated when merging chunks
+_ANALYSIS_LIST_KEYS = ("action_items", "ticket_updates", "story_points", "blockers", "decisions")
+
+# Upper bound on concurrent JIRA updates when applying a meeting's actions
+_MAX_ACTION_WORKERS = 10
+
+# Inputs per embeddings request; each chunk is at most _MAX_CHUNK_TOKENS tokens,
+# which keeps a request under the API's per-request token limit
+_EMBEDDING_BATCH_SIZE = 32
+
+# Number of most similar meetings sent to the model for a topic search
+_TOPIC_SEARCH_K = 8
+
+# Reverse index of ticket key -> [(meeting_id, mention formatter, item)], filled at ingest
+ticket_index = defaultdict(list)
+
+# Static parts of the analysis prompt, built once; the transcript goes in between
+_ANALYSIS_PROMPT_PREFIX = """
     Analyze this meeting transcript and extract:
     1. Action items with assignees
     2. Ticket updates (status changes, comments)
@@ -32,39 +155,252 @@ def analyze_transcript(transcript):
     5. Important decisions made
 
     Meeting transcript:
-    {transcript}
+    """
+_ANALYSIS_PROMPT_SUFFIX = """
     
     Format the response as JSON with these keys:
-    - action_items: list of {{"task": "...", "assignee": "..."}}
-    - ticket_updates: list of {{"ticket_key": "...", "status": "...", "comment": "..."}}
-    - story_points: list of {{"ticket_key": "...", "points": number}}
-    - blockers: list of {{"description": "...", "for_ticket": "...", "mentioned_by": "..."}}
-    - decisions: list of {{"topic": "...", "decision": "..."}}
+    - action_items: list of {"task": "...", "assignee": "..."}
+    - ticket_updates: list of {"ticket_key": "...", "status": "...", "comment": "..."}
+    - story_points: list of {"ticket_key": "...", "points": number}
+    - blockers: list of {"description": "...", "for_ticket": "...", "mentioned_by": "..."}
+    - decisions: list of {"topic": "...", "decision": "..."}
     - attendees: list of names of people who spoke in the meeting
     """
-    
+_ANALYSIS_SYSTEM_MESSAGE = {"role": "system", "content": "You extract structured information from meeting transcripts. Respond with JSON only."}
+
+def _analysis_messages(transcript):
+    """Build the chat messages that ask the model to analyze a transcript."""
+    return [
+        _ANALYSIS_SYSTEM_MESSAGE,
+        {"role": "user", "content": "".join((_ANALYSIS_PROMPT_PREFIX, transcript, _ANALYSIS_PROMPT_SUFFIX))}
+    ]
+
+def _transcript_key(transcript):
+    return hashlib.sha256(transcript.encode('utf-8')).hexdigest()
+
+def _cached_analysis(cache_key):
+    """Return a fresh copy of a cached analysis, or None on a miss."""
+    with _analysis_cache_lock:
+        content = _analysis_cache.get(cache_key)
+        if content is None:
+            return None
+        _analysis_cache.move_to_end(cache_key)
+        
+    logger.info("Reusing cached analysis for an identical transcript")
+    return _json_loads(content)
+
+def _remember_analysis(cache_key, extracted_data):
+    with _analysis_cache_lock:
+        _analysis_cache[cache_key] = _json_dumps(extracted_data)
+        _analysis_cache.move_to_end(cache_key)
+        while len(_analysis_cache) > _MAX_CACHED_ANALYSES:
+            _analysis_cache.popitem(last=False)
+
+def _parse_analysis(response):
+    """Parse the model's transcript analysis into a dict."""
+    content = response.choices[0].message.content
+    return _json_loads(content)
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    if tiktoken is None:
+        return None
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4",  # Use appropriate model
-            messages=[
-                {"role": "system", "content": "You extract structured information from meeting transcripts."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1  # Lower temperature for more predictable outputs
-        )
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding, estimating token counts: {str(e)}")
+        return None
+
+def _count_tokens(text):
+    """Count prompt tokens, estimating ~4 characters per token without tiktoken."""
+    encoding = _token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // 4 + 1
+
+def _split_transcript(transcript):
+    """Split a transcript at speaker-turn (line) boundaries into chunks that fit the context window."""
+    if _count_tokens(transcript) <= _MAX_CHUNK_TOKENS:
+        return [transcript]
         
-        # Parse the response
-        content = response.choices[0].message.content
-        extracted_data = json.loads(content)
+    chunks = []
+    current = []
+    current_tokens = 0
+    for line in transcript.splitlines(keepends=True):
+        line_tokens = _count_tokens(line)
         
-        logger.info(f"Successfully extracted data from transcript: {len(extracted_data.get('action_items', []))} action items, {len(extracted_data.get('ticket_updates', []))} ticket updates")
+        # A single overlong turn is cut into character slices of roughly chunk size
+        if line_tokens > _MAX_CHUNK_TOKENS:
+            step = max(1, len(line) * _MAX_CHUNK_TOKENS // line_tokens)
+            pieces = [line[i:i + step] for i in range(0, len(line), step)]
+        else:
+            pieces = [line]
+            
+        for piece in pieces:
+            piece_tokens = line_tokens if len(pieces) == 1 else _count_tokens(piece)
+            if current and current_tokens + piece_tokens > _MAX_CHUNK_TOKENS:
+                chunks.append("".join(current))
+                current = []
+                current_tokens = 0
+            current.append(piece)
+            current_tokens += piece_tokens
+            
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+def _normalize(vector):
+    """Scale a vector to unit length so a dot product gives cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return array('f', (x / norm for x in vector))
+
+def _embed_texts(texts):
+    """Embed texts in as few requests as possible.
+
+    Returns one unit-length vector per text, or None if embedding fails.
+    """
+    try:
+        vectors = []
+        for start in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+            response = _embedding_create(model=EMBEDDING_MODEL, input=texts[start:start + _EMBEDDING_BATCH_SIZE])
+            data = sorted(response["data"], key=lambda item: item["index"])
+            vectors.extend(_normalize(item["embedding"]) for item in data)
+        return vectors
         
-        return extracted_data
+    except Exception as e:
+        logger.error(f"Error embedding text: {str(e)}")
+        return None
+
+def _quantize(vector):
+    """Quantize a vector to int8 with a symmetric per-vector scale.
+
+    Returns (scale, codes) where vector[i] ~= scale * codes[i]; this stores a
+    1536-dim embedding in 1.5KB instead of 6KB.
+    """
+    peak = max(map(abs, vector), default=0.0)
+    scale = peak / 127 if peak else 1.0
+    return scale, array('b', (round(x / scale) for x in vector))
+
+def _embed_transcripts(transcripts):
+    """Embed transcripts, averaging the chunks of long ones.
+
+    Returns one quantized unit-length vector per transcript (None for each if
+    embedding fails).
+    """
+    chunks = []
+    owners = []
+    for i, transcript in enumerate(transcripts):
+        for chunk in _split_transcript(transcript):
+            chunks.append(chunk)
+            owners.append(i)
+            
+    vectors = _embed_texts(chunks) if chunks else None
+    if vectors is None:
+        return [None] * len(transcripts)
+        
+    sums = [None] * len(transcripts)
+    for owner, vector in zip(owners, vectors):
+        sums[owner] = vector if sums[owner] is None else [a + b for a, b in zip(sums[owner], vector)]
+    return [_quantize(_normalize(total)) if total is not None else None for total in sums]
+
+def _merge_analyses(parts):
+    """Combine per-chunk analyses into one, dropping exact duplicates."""
+    merged = {key: [] for key in _ANALYSIS_LIST_KEYS}
+    seen = {key: set() for key in _ANALYSIS_LIST_KEYS}
+    attendees = []
+    
+    for part in parts:
+        for key in _ANALYSIS_LIST_KEYS:
+            for item in part.get(key, []):
+                marker = _json_dumps_sorted(item)
+                if marker not in seen[key]:
+                    seen[key].add(marker)
+                    merged[key].append(item)
+        for name in part.get("attendees", []):
+            if name not in attendees:
+                attendees.append(name)
+                
+    merged["attendees"] = attendees
+    return merged
+
+def _analyze_chunk(chunk):
+    try:
+        response = _chat_completion(
+            model=EXTRACTION_MODEL,
+            messages=_analysis_messages(chunk),
+            temperature=0.1,  # Lower temperature for more predictable outputs
+            response_format=_JSON_RESPONSE
+        )
+        return _parse_analysis(response)
         
     except Exception as e:
         logger.error(f"Error extracting data from transcript: {str(e)}")
         return None
 
+async def _analyze_chunk_async(chunk):
+    try:
+        response = await _chat_completion_async(
+            model=EXTRACTION_MODEL,
+            messages=_analysis_messages(chunk),
+            temperature=0.1,
+            response_format=_JSON_RESPONSE
+        )
+        return _parse_analysis(response)
+        
+    except Exception as e:
+        logger.error(f"Error extracting data from transcript: {str(e)}")
+        return None
+
+def _finish_analysis(cache_key, parts):
+    """Merge chunk results, cache the analysis and log it; None if any chunk failed."""
+    if any(part is None for part in parts):
+        return None
+        
+    extracted_data = parts[0] if len(parts) == 1 else _merge_analyses(parts)
+    _remember_analysis(cache_key, extracted_data)
+    
+    logger.info(f"Successfully extracted data from transcript: {len(extracted_data.get('action_items', []))} action items, {len(extracted_data.get('ticket_updates', []))} ticket updates")
+    
+    return extracted_data
+
+def analyze_transcript(transcript):
+    """Process a meeting transcript and extract structured data.
+
+    Transcripts too long for one prompt are split on speaker turns,
+    analyzed chunk by chunk in parallel and merged.
+    """
+    if not openai.api_key:
+        logger.warning("OpenAI API key not set, using mock data")
+        return mock_meeting_data()
+        
+    cache_key = _transcript_key(transcript)
+    cached = _cached_analysis(cache_key)
+    if cached is not None:
+        return cached
+        
+    chunks = _split_transcript(transcript)
+    if len(chunks) == 1:
+        parts = [_analyze_chunk(transcript)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_ACTION_WORKERS, len(chunks))) as executor:
+            parts = list(executor.map(_analyze_chunk, chunks))
+            
+    return _finish_analysis(cache_key, parts)
+
+async def analyze_transcript_async(transcript):
+    """Async variant of analyze_transcript, so several transcripts can be analyzed concurrently."""
+    if not openai.api_key:
+        logger.warning("OpenAI API key not set, using mock data")
+        return mock_meeting_data()
+        
+    cache_key = _transcript_key(transcript)
+    cached = _cached_analysis(cache_key)
+    if cached is not None:
+        return cached
+        
+    parts = await asyncio.gather(*(_analyze_chunk_async(c) for c in _split_transcript(transcript)))
+    return _finish_analysis(cache_key, list(parts))
+
 def mock_meeting_data():
     """Return mock meeting data for testing when OpenAI is not available."""
     return {
@@ -89,6 +425,15 @@ def mock_meeting_data():
         "attendees": ["John", "Sarah", "David", "Emily"]
     }
 
+def _run_meeting_action(section, ticket_key, update_kwargs, extra, error_label):
+    """Apply one meeting action to JIRA and describe the outcome."""
+    try:
+        success = update_jira_ticket(ticket_key=ticket_key, **update_kwargs)
+        return {"ticket_key": ticket_key, **extra, "success": success}
+    except Exception as e:
+        logger.error(f"Error {error_label} {ticket_key}: {str(e)}")
+        return {"ticket_key": ticket_key, "success": False, "error": str(e)}
+
 def apply_meeting_actions(meeting_data):
     """Apply actions extracted from a meeting to JIRA."""
     results = {
@@ -97,74 +442,120 @@ def apply_meeting_actions(meeting_data):
         "story_points_updated": []
     }
     
+    jobs = []
+    
     # Process ticket updates
     for update in meeting_data.get("ticket_updates", []):
         if "ticket_key" in update:
-            try:
-                success = update_jira_ticket(
-                    ticket_key=update["ticket_key"],
-                    status=update.get("status"),
-                    comment=update.get("comment")
-                )
-                
-                results["ticket_updates"].append({
-                    "ticket_key": update["ticket_key"],
-                    "success": success
-                })
-            except Exception as e:
-                logger.error(f"Error updating ticket {update['ticket_key']}: {str(e)}")
-                results["ticket_updates"].append({
-                    "ticket_key": update["ticket_key"],
-                    "success": False,
-                    "error": str(e)
-                })
+            jobs.append(("ticket_updates", update["ticket_key"], {
+                "status": update.get("status"),
+                "comment": update.get("comment")
+            }, {}, "updating ticket"))
     
     # Process blockers
     for blocker in meeting_data.get("blockers", []):
         if "for_ticket" in blocker:
-            try:
-                comment = f"🚫 **BLOCKER** reported by {blocker.get('mentioned_by', 'someone')}: {blocker.get('description', 'No description')}"
-                success = update_jira_ticket(
-                    ticket_key=blocker["for_ticket"],
-                    comment=comment
-                )
-                
-                results["blockers_added"].append({
-                    "ticket_key": blocker["for_ticket"],
-                    "success": success
-                })
-            except Exception as e:
-                logger.error(f"Error adding blocker for {blocker['for_ticket']}: {str(e)}")
-                results["blockers_added"].append({
-                    "ticket_key": blocker["for_ticket"],
-                    "success": False,
-                    "error": str(e)
-                })
+            comment = f"🚫 **BLOCKER** reported by {blocker.get('mentioned_by', 'someone')}: {blocker.get('description', 'No description')}"
+            jobs.append(("blockers_added", blocker["for_ticket"], {"comment": comment}, {}, "adding blocker for"))
     
     # Process story points
     for sp_update in meeting_data.get("story_points", []):
         if "ticket_key" in sp_update and "points" in sp_update:
-            try:
-                success = update_jira_ticket(
-                    ticket_key=sp_update["ticket_key"],
-                    story_points=sp_update["points"]
-                )
-                
-                results["story_points_updated"].append({
-                    "ticket_key": sp_update["ticket_key"],
-                    "points": sp_update["points"],
-                    "success": success
-                })
-            except Exception as e:
-                logger.error(f"Error updating story points for {sp_update['ticket_key']}: {str(e)}")
-                results["story_points_updated"].append({
-                    "ticket_key": sp_update["ticket_key"],
-                    "success": False,
-                    "error": str(e)
-                })
+            jobs.append(("story_points_updated", sp_update["ticket_key"], {
+                "story_points": sp_update["points"]
+            }, {"points": sp_update["points"]}, "updating story points for"))
+    
+    if not jobs:
+        return results
+        
+    # Each update is an independent JIRA round-trip, so run them concurrently;
+    # results are collected in submission order to keep the report stable
+    with ThreadPoolExecutor(max_workers=min(_MAX_ACTION_WORKERS, len(jobs))) as executor:
+        futures = [(job[0], executor.submit(_run_meeting_action, *job)) for job in jobs]
+        for section, future in futures:
+            results[section].append(future.result())
     
     return results
 
+# Fields of a meeting_memory record that are shared with the model
+_MEETING_RECORD_FIELDS = ("transcript", "summary", "timestamp")
+
+# Prompt-ready JSON of meeting memory, rebuilt only after a meeting is stored
+_meetings_json = None
+
+def _meeting_memory_json():
+    """Serialize meeting memory for the topic-search prompt, reusing the last result."""
+    global _meetings_json
+    if _meetings_json is None:
+        # Send only the meeting records themselves, not the derived search fields
+        records = {
+            meeting_id: {key: data[key] for key in _MEETING_RECORD_FIELDS if key in data}
+            for meeting_id, data in meeting_memory.items()
+        }
+        _meetings_json = _json_dumps(records)
+    return _meetings_json
+
+def _timestamp_display(data):
+    """Return a meeting's time for display, preferring the datetime parsed at ingest."""
+    timestamp_dt = data.get("timestamp_dt")
+    if timestamp_dt is not None:
+        return timestamp_dt
+    timestamp = data.get("timestamp", "Unknown")
+    return datetime.fromisoformat(timestamp) if timestamp != "Unknown" else "Unknown time"
+
+def _topic_meetings_json(topic):
+    """Serialize the meetings most relevant to a topic for the topic-search prompt.
+
+    Meetings are ranked by embedding similarity to the topic so the prompt holds at
+    most _TOPIC_SEARCH_K of them; meetings without an embedding are always included.
+    Falls back to all of meeting memory when there are few meetings or the topic
+    cannot be embedded.
+    """
+    if len(meeting_memory) <= _TOPIC_SEARCH_K:
+        return _meeting_memory_json()
+        
+    query = _embed_texts([topic])
+    if query is None:
+        return _meeting_memory_json()
+    query = query[0]
+    
+    embedded = []
+    selected = set()
+    for meeting_id, data in meeting_memory.items():
+        embedding = data.get("embedding")
+        if embedding is None:
+            selected.add(meeting_id)
+        else:
+            scale, codes = embedding
+            embedded.append((scale * sum(map(operator.mul, query, codes)), meeting_id))
+    selected.update(meeting_id for _, meeting_id in heapq.nlargest(_TOPIC_SEARCH_K, embedded))
+    
+    # Keep the selected meetings in chronological order
+    records = {
+        meeting_id: {key: data[key] for key in _MEETING_RECORD_FIELDS if key in data}
+        for meeting_id, data in meeting_memory.items() if meeting_id in selected
+    }
+    return _json_dumps(records)
+
+def _topic_search_messages(topic):
+    """Build the chat messages that ask the model to search meeting memory."""
+    meetings_json = _topic_meetings_json(topic)
+    
+    prompt = f"""
+    Search through these meeting records and find information about: "{topic}"
+    
+    Meeting records:
+    {meetings_json}
+    
+    Return a concise summary of what was discussed about this topic across all meetings,
+    including when it was discussed, decisions made, and any action items.
+    """
+    
+    return [
+        {"role": "system", "content": "You search through meeting records and provide concise summaries."},
+        {"role": "user", "content": prompt}
+    ]
+
 def search_meeting_memory(topic=None):
     """Search through meeting memory for information about a topic."""
     if not meeting_memory:
@@ -174,24 +565,9 @@ def search_meeting_memory(topic=None):
         # If OpenAI API is available, use it to search through meeting memory
         if openai.api_key:
             try:
-                meetings_json = json.dumps(meeting_memory)
-                
-                prompt = f"""
-                Search through these meeting records and find information about: "{topic}"
-                
-                Meeting records:
-                {meetings_json}
-                
-                Return a concise summary of what was discussed about this topic across all meetings,
-                including when it was discussed, decisions made, and any action items.
-                """
-                
-                response = openai.ChatCompletion.create(
+                response = _chat_completion(
                     model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": "You search through meeting records and provide concise summaries."},
-                        {"role": "user", "content": prompt}
-                    ]
+                    messages=_topic_search_messages(topic)
                 )
                 
                 return response.choices[0].message.content
@@ -200,16 +576,30 @@ def search_meeting_memory(topic=None):
                 logger.error(f"Error searching meeting memory: {str(e)}")
                 return f"Error searching meeting memory: {str(e)}"
         
-        # If OpenAI is not available, do a simple keyword search
+        # If OpenAI is not available, look the topic up in the full-text index
+        matches = search_meetings(topic)
+        if matches is None:
+            # Index unavailable; fall back to a keyword scan of meeting memory,
+            # using the lowercased bytes precomputed at ingest
+            needle = topic.lower().encode('utf-8')
+            matches = []
+            for meeting_id, data in meeting_memory.items():
+                haystack = data.get("search_text")
+                if haystack is None:
+                    haystack = _search_text(data.get("transcript", ""), data.get("summary", {}))
+                
+                if needle in haystack:
+                    matches.append((meeting_id, data.get("timestamp", "Unknown")))
+        
         results = []
-        for meeting_id, data in meeting_memory.items():
-            transcript = data.get("transcript", "").lower()
-            summary = json.dumps(data.get("summary", {})).lower()
-            
-            if topic.lower() in transcript or topic.lower() in summary:
-                timestamp = data.get("timestamp", "Unknown")
+        for meeting_id, timestamp in matches:
+            data = meeting_memory.get(meeting_id)
+            if data is not None:
+                timestamp_display = _timestamp_display(data)
+            else:
+                # Evicted from memory but still in the index
                 timestamp_display = datetime.fromisoformat(timestamp) if timestamp != "Unknown" else "Unknown time"
-                results.append(f"- Meeting on {timestamp_display}: Found mention of '{topic}'")
+            results.append(f"- Meeting on {timestamp_display}: Found mention of '{topic}'")
         
         if results:
             return f"**Search Results for '{topic}'**\n\n" + "\n".join(results)
@@ -219,8 +609,7 @@ def search_meeting_memory(topic=None):
         # Return a list of all recorded meetings
         meetings_list = []
         for meeting_id, data in meeting_memory.items():
-            timestamp = data.get("timestamp", "Unknown")
-            timestamp_display = datetime.fromisoformat(timestamp) if timestamp != "Unknown" else "Unknown time"
+            timestamp_display = _timestamp_display(data)
             summary = data.get("summary", {})
             decisions = summary.get("decisions", [])
             topics = [d.get("topic", "Unknown topic") for d in decisions]
@@ -233,6 +622,49 @@ def search_meeting_memory(topic=None):
         else:
             return "No meetings have been recorded yet."
 
+async def search_meeting_memory_async(topic=None):
+    """Async variant of search_meeting_memory for the model-backed topic search."""
+    if not (meeting_memory and topic and openai.api_key):
+        return search_meeting_memory(topic)
+        
+    try:
+        # Embedding the topic is a blocking call; keep it off the event loop
+        messages = await asyncio.to_thread(_topic_search_messages, topic)
+        response = await _chat_completion_async(
+            model="gpt-4",
+            messages=messages
+        )
+        
+        return response.choices[0].message.content
+        
+    except Exception as e:
+        logger.error(f"Error searching meeting memory: {str(e)}")
+        return f"Error searching meeting memory: {str(e)}"
+
+def find_topic_mentions(topics):
+    """Find the meetings that mention each of several topics.
+
+    Each topic is searched with bytes.find, so topics that overlap in the text
+    (e.g. "front end" and "end user" in "front end user") are all reported.
+    Returns {topic: [(meeting_id, timestamp), ...]} with meetings oldest first.
+    """
+    needles = {topic: topic.lower().encode('utf-8') for topic in topics if topic}
+    mentions = {topic: [] for topic in needles}
+    if not needles:
+        return mentions
+    
+    for meeting_id, data in meeting_memory.items():
+        haystack = data.get("search_text")
+        if haystack is None:
+            haystack = _search_text(data.get("transcript", ""), data.get("summary", {}))
+            
+        timestamp = data.get("timestamp", "Unknown")
+        for topic, needle in needles.items():
+            if haystack.find(needle) >= 0:
+                mentions[topic].append((meeting_id, timestamp))
+    
+    return mentions
+
 def generate_daily_summary(sprint_id=None):
     """Generate a daily summary of sprint activity."""
     # Use JIRA API to get recent activity
@@ -267,83 +699,121 @@ def generate_daily_summary(sprint_id=None):
     - RCVNC-124: UI improvements completed (ready for code review)
     """
 
+def _format_status_mention(update):
+    status_text = f" → {update.get('status')}" if update.get("status") else ""
+    comment_text = f": {update.get('comment')}" if update.get("comment") else ""
+    return f"Status update{status_text}{comment_text}"
+
+def _format_story_points_mention(sp):
+    return f"Story points estimated: {sp.get('points')}"
+
+def _format_blocker_mention(blocker):
+    return f"Blocker reported: {blocker.get('description')} (by {blocker.get('mentioned_by')})"
+
+# (summary section, field holding the ticket key, mention formatter)
+_TICKET_SECTIONS = (
+    ("ticket_updates", "ticket_key", _format_status_mention),
+    ("story_points", "ticket_key", _format_story_points_mention),
+    ("blockers", "for_ticket", _format_blocker_mention)
+)
+
+def _index_ticket_mentions(meeting_id, meeting_data):
+    """Record which tickets a meeting mentions in the reverse index."""
+    for section, key_field, format_mention in _TICKET_SECTIONS:
+        for item in meeting_data.get(section, ()):
+            ticket_key = item.get(key_field)
+            if ticket_key:
+                ticket_index[ticket_key].append((meeting_id, format_mention, item))
+
 def get_meeting_history_for_ticket(ticket_key):
     """Get meeting history related to a specific ticket."""
-    if not meeting_memory:
+    if not ticket_index:
         return "No meeting records found for this ticket."
         
-    ticket_mentions = []
-    
-    for meeting_id, data in meeting_memory.items():
-        timestamp = data.get("timestamp", "Unknown")
-        timestamp_display = datetime.fromisoformat(timestamp) if timestamp != "Unknown" else "Unknown time"
-        summary = data.get("summary", {})
+    # Drop mentions from meetings that are no longer stored
+    entries = [e for e in ticket_index.get(ticket_key, ()) if _load_meeting(e[0]) is not None]
+    if ticket_key in ticket_index:
+        ticket_index[ticket_key] = entries
         
-        # Check for ticket mentions in different sections
-        mentioned = False
-        mention_context = []
-        
-        # Check ticket updates
-        for update in summary.get("ticket_updates", []):
-            if update.get("ticket_key") == ticket_key:
-                status_text = f" → {update.get('status')}" if update.get("status") else ""
-                comment_text = f": {update.get('comment')}" if update.get("comment") else ""
-                mention_context.append(f"Status update{status_text}{comment_text}")
-                mentioned = True
-        
-        # Check story points
-        for sp in summary.get("story_points", []):
-            if sp.get("ticket_key") == ticket_key:
-                mention_context.append(f"Story points estimated: {sp.get('points')}")
-                mentioned = True
-        
-        # Check blockers
-        for blocker in summary.get("blockers", []):
-            if blocker.get("for_ticket") == ticket_key:
-                mention_context.append(f"Blocker reported: {blocker.get('description')} (by {blocker.get('mentioned_by')})")
-                mentioned = True
-        
-        # If ticket was mentioned, add to results
-        if mentioned:
-            context_text = ", ".join(mention_context)
-            ticket_mentions.append(f"- Meeting on {timestamp_display}: {context_text}")
+    # Group this ticket's mentions by meeting
+    mentions_by_meeting = OrderedDict()
+    for meeting_id, format_mention, item in entries:
+        mentions_by_meeting.setdefault(meeting_id, []).append(format_mention(item))
+    
+    ticket_mentions = []
+    for meeting_id, mention_context in mentions_by_meeting.items():
+        timestamp_display = _timestamp_display(_load_meeting(meeting_id))
+        context_text = ", ".join(mention_context)
+        ticket_mentions.append(f"- Meeting on {timestamp_display}: {context_text}")
     
     if ticket_mentions:
         return f"**Meeting History for {ticket_key}**\n\n" + "\n".join(ticket_mentions)
     else:
         return f"No meeting discussions found for ticket {ticket_key}."
 
-def extract_action_items_from_text(text):
-    """Extract action items from free-form text."""
-    if not openai.api_key:
-        logger.warning("OpenAI API key not set, using basic extraction")
-        # Basic extraction with regex could be implemented here
-        return []
-        
-    prompt = f"""
+# Static parts of the action-item prompt, built once; the text goes in between
+_ACTION_ITEM_PROMPT_PREFIX = """
     Extract action items from this text. An action item is a task that needs to be done, preferably with an assignee.
     
     Text:
-    {text}
+    """
+_ACTION_ITEM_PROMPT_SUFFIX = """
     
-    Format the response as JSON with a list of action items, each with:
+    Format the response as a JSON object with an "action_items" list, each item with:
     - task: the task to be done
     - assignee: the person assigned to the task (if mentioned)
     """
-    
+_ACTION_ITEM_SYSTEM_MESSAGE = {"role": "system", "content": "You extract action items from text. Respond with JSON only."}
+
+def _action_item_messages(text):
+    """Build the chat messages that ask the model for action items."""
+    return [
+        _ACTION_ITEM_SYSTEM_MESSAGE,
+        {"role": "user", "content": "".join((_ACTION_ITEM_PROMPT_PREFIX, text, _ACTION_ITEM_PROMPT_SUFFIX))}
+    ]
+
+def extract_action_items_from_text(text):
+    """Extract action items from free-form text."""
+    if not openai.api_key:
+        logger.warning("OpenAI API key not set, using basic extraction")
+        # Basic extraction with regex could be implemented here
+        return []
+        
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You extract action items from text."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1
+        response = _chat_completion(
+            model=EXTRACTION_MODEL,
+            messages=_action_item_messages(text),
+            temperature=0.1,
+            response_format=_JSON_RESPONSE
         )
         
         # Parse the response
         content = response.choices[0].message.content
-        action_items = json.loads(content)
+        action_items = _json_loads(content)
+        
+        return action_items.get("action_items", [])
+        
+    except Exception as e:
+        logger.error(f"Error extracting action items: {str(e)}")
+        return []
+
+async def extract_action_items_from_text_async(text):
+    """Async variant of extract_action_items_from_text."""
+    if not openai.api_key:
+        logger.warning("OpenAI API key not set, using basic extraction")
+        return []
+        
+    try:
+        response = await _chat_completion_async(
+            model=EXTRACTION_MODEL,
+            messages=_action_item_messages(text),
+            temperature=0.1,
+            response_format=_JSON_RESPONSE
+        )
+        
+        # Parse the response
+        content = response.choices[0].message.content
+        action_items = _json_loads(content)
         
         return action_items.get("action_items", [])
         
@@ -352,67 +822,290 @@ def extract_action_items_from_text(text):
         return []
 
 def parse_transcript_file(file_path):
-    """Parse a transcript file."""
+    """Parse a transcript file.
+
+    The file is memory-mapped and decoded straight from the mapping, so large
+    transcripts are not first copied into an intermediate bytes buffer.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            transcript = f.read()
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                transcript = str(mm, 'utf-8')
+                has_cr = mm.find(b'\r') != -1
+                
+        # Match text-mode reads, which translate Windows and old Mac line endings
+        if has_cr:
+            transcript = transcript.replace('\r\n', '\n').replace('\r', '\n')
         return transcript
     except Exception as e:
         logger.error(f"Error parsing transcript file: {str(e)}")
         return None
 
+def _search_text(transcript_content, meeting_data):
+    """Lowercased UTF-8 transcript and summary JSON, joined for a single substring scan."""
+    return b"\0".join((transcript_content.lower().encode('utf-8'), json.dumps(meeting_data, ensure_ascii=False).lower().encode('utf-8')))
+
+def _meeting_record(transcript_content, meeting_data, timestamp_dt, embedding=None):
+    """Build the in-memory record for a meeting, with fields derived once per meeting."""
+    return {
+        "transcript": transcript_content,
+        "summary": meeting_data,
+        "timestamp": timestamp_dt.isoformat(),
+        # Parsed once here so listings do not re-parse the ISO string
+        "timestamp_dt": timestamp_dt,
+        # Lowercased bytes for keyword search, computed once here instead of per query
+        "search_text": _search_text(transcript_content, meeting_data),
+        # Quantized unit-length transcript embedding for the topic-search prefilter
+        "embedding": embedding
+    }
+
+def _load_meeting(meeting_id):
+    """Return a meeting from memory, reading it back from the meeting store on a miss."""
+    global _meetings_json
+    
+    data = meeting_memory.get(meeting_id)
+    if data is None:
+        stored = get_meeting(meeting_id)
+        if stored is None:
+            return None
+        data = _meeting_record(
+            stored["transcript"], stored["summary"],
+            datetime.fromisoformat(stored["timestamp"]), stored["embedding"]
+        )
+        remember_meeting(meeting_id, data)
+        _meetings_json = None
+    return data
+
+def _warm_meeting_cache():
+    """Load the newest stored meetings into memory and the ticket index at startup."""
+    meeting_ids = recent_meeting_ids(MAX_MEETINGS) or []
+    for meeting_id in reversed(meeting_ids):
+        data = _load_meeting(meeting_id)
+        if data is not None:
+            _index_ticket_mentions(meeting_id, data["summary"])
+
+def _existing_meeting(transcript_content):
+    """Return the stored result for a transcript that was already processed, or None.
+
+    Nothing is re-analyzed, re-embedded or re-applied to JIRA for a duplicate.
+    """
+    meeting_id = find_meeting_by_hash(_transcript_key(transcript_content))
+    data = _load_meeting(meeting_id) if meeting_id else None
+    if data is None:
+        return None
+        
+    logger.info(f"Transcript was already processed as meeting {meeting_id}")
+    return {
+        "meeting_id": meeting_id,
+        "meeting_data": data["summary"],
+        "action_results": {"ticket_updates": [], "blockers_added": [], "story_points_updated": []},
+        "duplicate": True
+    }
+
+def _store_meeting(transcript_content, meeting_data, embedding=None):
+    """Store an analyzed meeting and apply its actions to JIRA.
+
+    Bulk ingestion passes an embedding computed in a batch; otherwise the
+    transcript is embedded here when OpenAI is available.
+    """
+    global _meetings_json
+    
+    # Catch duplicates within one batch, which were analyzed side by side
+    existing = _existing_meeting(transcript_content)
+    if existing:
+        return existing
+        
+    if embedding is None and openai.api_key:
+        embedding = _embed_transcripts([transcript_content])[0]
+        
+    # Persist the meeting, then cache it in memory and the full-text index
+    meeting_id = new_meeting_id()
+    record = _meeting_record(transcript_content, meeting_data, datetime.now(), embedding)
+    store_meeting(meeting_id, record, _transcript_key(transcript_content))
+    remember_meeting(meeting_id, record)
+    index_meeting(meeting_id, record["timestamp"], transcript_content, meeting_data)
+    _index_ticket_mentions(meeting_id, meeting_data)
+    
+    # The store and the index keep the same newest MAX_MEETINGS as meeting_memory
+    removed = prune_meetings(MAX_MEETINGS)
+    if removed:
+        remove_meetings(removed)
+    
+    # Meeting memory changed, so the cached prompt JSON is stale
+    _meetings_json = None
+    
+    logger.info(f"Stored meeting transcript with ID {meeting_id}")
+    
+    # Apply actions
+    action_results = apply_meeting_actions(meeting_data)
+    logger.info(f"Applied actions: {len(action_results['ticket_updates'])} ticket updates, {len(action_results['blockers_added'])} blockers added")
+    
+    # Return meeting data and action results
+    return {
+        "meeting_id": meeting_id,
+        "meeting_data": meeting_data,
+        "action_results": action_results
+    }
+
 def process_transcript_content(transcript_content):
     """Process transcript content from a file or input."""
     if not transcript_content:
         return None
         
+    # Skip everything for a transcript that was already processed
+    existing = _existing_meeting(transcript_content)
+    if existing:
+        return existing
+        
     # Analyze the transcript
     meeting_data = analyze_transcript(transcript_content)
     
     if meeting_data:
-        # Store in meeting memory
-        meeting_id = datetime.now().strftime("%Y%m%d%H%M%S")
-        meeting_memory[meeting_id] = {
-            "transcript": transcript_content,
-            "summary": meeting_data,
-            "timestamp": datetime.now().isoformat()
-        }
+        return _store_meeting(transcript_content, meeting_data)
+    
+    return None
+
+async def process_transcripts_async(transcripts):
+    """Analyze several transcripts concurrently, then store and apply each one.
+
+    Returns one result per transcript, None where it was empty or failed.
+    """
+    # Transcripts that were already processed are returned without re-analysis
+    results = await asyncio.to_thread(lambda: [_existing_meeting(t) if t else None for t in transcripts])
+    pending = [t if t and result is None else None for t, result in zip(transcripts, results)]
+    
+    analyses = await asyncio.gather(*(
+        analyze_transcript_async(t) if t else asyncio.sleep(0) for t in pending
+    ))
+    
+    # Embed every analyzed transcript in one batch rather than one request each
+    analyzed = [t for t, meeting_data in zip(pending, analyses) if meeting_data]
+    embeddings = iter(await asyncio.to_thread(_embed_transcripts, analyzed) if analyzed and openai.api_key else ())
+    
+    for i, (transcript_content, meeting_data) in enumerate(zip(pending, analyses)):
+        if meeting_data:
+            # Applying actions makes blocking JIRA calls; keep them off the event loop
+            embedding = next(embeddings, None)
+            results[i] = await asyncio.to_thread(_store_meeting, transcript_content, meeting_data, embedding)
+    
+    return results
+
+def _openai_headers():
+    return {"Authorization": f"Bearer {openai.api_key}"}
+
+def bulk_analyze_transcripts(transcripts, poll_interval=60):
+    """Analyze many transcripts through the OpenAI Batch API, then store and apply each one.
+
+    Batch jobs cost half as much and do not count against the rate limit, but
+    can take up to 24 hours, so this blocks and is meant for offline ingestion.
+    Returns one result per transcript, None where it was empty or failed; a
+    transcript that was already processed gets its existing meeting back.
+    """
+    if not openai.api_key:
+        logger.warning("OpenAI API key not set, analyzing transcripts one by one")
+        return [process_transcript_content(t) for t in transcripts]
         
-        logger.info(f"Stored meeting transcript with ID {meeting_id}")
+    # Transcripts that were already processed are returned without re-analysis
+    existing = [_existing_meeting(t) if t else None for t in transcripts]
+    
+    try:
+        # One chat completion request per transcript, matched back up by custom_id
+        lines = [
+            _json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": EXTRACTION_MODEL, "messages": _analysis_messages(t), "temperature": 0.1, "response_format": _JSON_RESPONSE}
+            })
+            for i, t in enumerate(transcripts) if t and existing[i] is None
+        ]
+        if not lines:
+            return existing
+            
+        session = get_openai_session()
+        response = session.post(
+            f"{openai.api_base}/files",
+            headers=_openai_headers(),
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", "\n".join(lines).encode("utf-8"))}
+        )
+        response.raise_for_status()
+        input_file_id = response.json()["id"]
         
-        # Apply actions
-        action_results = apply_meeting_actions(meeting_data)
-        logger.info(f"Applied actions: {len(action_results['ticket_updates'])} ticket updates, {len(action_results['blockers_added'])} blockers added")
+        response = session.post(
+            f"{openai.api_base}/batches",
+            headers=_openai_headers(),
+            json={"input_file_id": input_file_id, "endpoint": "/v1/chat/completions", "completion_window": "24h"}
+        )
+        response.raise_for_status()
+        batch = response.json()
+        logger.info(f"Submitted batch {batch['id']} with {len(lines)} transcripts")
         
-        # Return meeting data and action results
-        return {
-            "meeting_id": meeting_id,
-            "meeting_data": meeting_data,
-            "action_results": action_results
-        }
-    
-    return None
+        # Wait for the batch to finish
+        while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            response = session.get(f"{openai.api_base}/batches/{batch['id']}", headers=_openai_headers())
+            response.raise_for_status()
+            batch = response.json()
+            
+        if batch["status"] != "completed" or not batch.get("output_file_id"):
+            logger.error(f"Batch {batch['id']} ended with status {batch['status']}")
+            return existing
+            
+        response = session.get(f"{openai.api_base}/files/{batch['output_file_id']}/content", headers=_openai_headers())
+        response.raise_for_status()
+        output = response.text
+        
+    except Exception as e:
+        logger.error(f"Error running transcript batch: {str(e)}")
+        return existing
+        
+    # Embed all transcripts in batched requests rather than one request each
+    embeddings = [None] * len(transcripts)
+    indexes = [i for i, t in enumerate(transcripts) if t and existing[i] is None]
+    for i, embedding in zip(indexes, _embed_transcripts([transcripts[i] for i in indexes])):
+        embeddings[i] = embedding
+        
+    # Fan the analyses back out into meeting memory
+    results = existing
+    for line in output.splitlines():
+        if not line:
+            continue
+        try:
+            item = _json_loads(line)
+            body = item["response"]["body"]
+            content = body["choices"][0]["message"]["content"]
+            i = int(item["custom_id"])
+            results[i] = _store_meeting(transcripts[i], _json_loads(content), embeddings[i])
+        except Exception as e:
+            logger.error(f"Error processing batch result: {str(e)}")
+            
+    return results
 
 def get_recent_meetings(max_count=5):
     """Get the most recent meetings."""
-    if not meeting_memory:
-        return []
-        
-    # Sort meetings by timestamp (newest first)
-    sorted_meetings = sorted(
-        [(meeting_id, data) for meeting_id, data in meeting_memory.items()],
-        key=lambda x: x[1].get("timestamp", "0"),
-        reverse=True
-    )
+    meeting_ids = recent_meeting_ids(max_count)
+    if meeting_ids is not None:
+        recent_meetings = [(meeting_id, _load_meeting(meeting_id)) for meeting_id in meeting_ids]
+        recent_meetings = [(meeting_id, data) for meeting_id, data in recent_meetings if data is not None]
+    else:
+        # Store unavailable; take the most recent cached meetings (newest first)
+        # without sorting every meeting
+        recent_meetings = heapq.nlargest(
+            max_count,
+            meeting_memory.items(),
+            key=lambda x: x[1].get("timestamp", "0")
+        )
     
-    # Take the most recent ones
-    recent_meetings = sorted_meetings[:max_count]
+    if not recent_meetings:
+        return []
     
     # Format the results
     formatted_meetings = []
     for meeting_id, data in recent_meetings:
-        timestamp = data.get("timestamp", "Unknown")
-        timestamp_display = datetime.fromisoformat(timestamp) if timestamp != "Unknown" else "Unknown time"
+        timestamp_display = _timestamp_display(data)
         summary = data.get("summary", {})
         
         # Get key metrics
@@ -428,4 +1121,6 @@ def get_recent_meetings(max_count=5):
             "decisions_count": decisions_count
         })
     
-    return formatted_meetings
\ No newline at end of file
+    return formatted_meetings
+
+_warm_meeting_cache()
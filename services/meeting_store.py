@@ -0,0 +1,156 @@
+"""
+Durable storage for recorded meetings, backed by SQLite.
+
+meeting_memory in config stays as a bounded read cache in front of this store.
+"""
+
+import os
+import json
+import struct
+import sqlite3
+import logging
+import threading
+from array import array
+from config import DATA_DIR
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Where meetings are stored; a file keeps them across restarts and shares them
+# between workers (':memory:' keeps them for the process lifetime only)
+MEETING_STORE_PATH = os.environ.get('MEETING_STORE_PATH', os.path.join(DATA_DIR, 'meetings.db'))
+
+_conn = None
+_lock = threading.Lock()
+
+def _connection():
+    """Open the store on first use and create the table if needed."""
+    global _conn
+    if _conn is None:
+        if MEETING_STORE_PATH != ':memory:':
+            os.makedirs(os.path.dirname(MEETING_STORE_PATH) or '.', exist_ok=True)
+        conn = sqlite3.connect(MEETING_STORE_PATH, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meetings ("
+            "meeting_id TEXT PRIMARY KEY, timestamp TEXT NOT NULL, "
+            "transcript TEXT NOT NULL, summary_json TEXT NOT NULL, embedding BLOB, content_hash TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS meetings_timestamp ON meetings (timestamp)")
+        conn.execute("CREATE INDEX IF NOT EXISTS meetings_content_hash ON meetings (content_hash)")
+        _conn = conn
+    return _conn
+
+def _record(row):
+    """Turn a (timestamp, transcript, summary_json, embedding) row into a meeting record."""
+    timestamp, transcript, summary_json, embedding = row
+    return {
+        "transcript": transcript,
+        "summary": json.loads(summary_json),
+        "timestamp": timestamp,
+        "embedding": _decode_embedding(embedding)
+    }
+
+# An embedding is stored as its float32 scale followed by its int8 codes
+_SCALE = struct.Struct('<f')
+
+def _encode_embedding(embedding):
+    if embedding is None:
+        return None
+    scale, codes = embedding
+    return _SCALE.pack(scale) + codes.tobytes()
+
+def _decode_embedding(blob):
+    if blob is None:
+        return None
+    codes = array('b')
+    codes.frombytes(blob[_SCALE.size:])
+    return _SCALE.unpack_from(blob)[0], codes
+
+def store_meeting(meeting_id, record, content_hash=None):
+    """Save a meeting record with transcript, summary, ISO timestamp and optional quantized embedding.
+
+    content_hash identifies the transcript text so re-uploads can be found with find_meeting_by_hash.
+    """
+    try:
+        with _lock:
+            _connection().execute(
+                "INSERT OR REPLACE INTO meetings (meeting_id, timestamp, transcript, summary_json, embedding, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    meeting_id, record["timestamp"], record["transcript"],
+                    json.dumps(record["summary"]), _encode_embedding(record.get("embedding")), content_hash
+                )
+            )
+        return True
+
+    except Exception as e:
+        logger.error(f"Error storing meeting {meeting_id}: {str(e)}")
+        return False
+
+def get_meeting(meeting_id):
+    """Return a stored meeting record, or None if it is missing or the store is unavailable."""
+    try:
+        with _lock:
+            row = _connection().execute(
+                "SELECT timestamp, transcript, summary_json, embedding FROM meetings WHERE meeting_id = ?",
+                (meeting_id,)
+            ).fetchone()
+        return _record(row) if row else None
+
+    except Exception as e:
+        logger.error(f"Error loading meeting {meeting_id}: {str(e)}")
+        return None
+
+def find_meeting_by_hash(content_hash):
+    """Return the ID of the earliest meeting stored with this content hash, or None."""
+    try:
+        with _lock:
+            row = _connection().execute(
+                "SELECT meeting_id FROM meetings WHERE content_hash = ? ORDER BY timestamp LIMIT 1",
+                (content_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    except Exception as e:
+        logger.error(f"Error looking up meeting by content hash: {str(e)}")
+        return None
+
+def recent_meeting_ids(limit):
+    """Return the IDs of the newest meetings, newest first, or None on error."""
+    try:
+        with _lock:
+            rows = _connection().execute(
+                "SELECT meeting_id FROM meetings ORDER BY timestamp DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    except Exception as e:
+        logger.error(f"Error listing recent meetings: {str(e)}")
+        return None
+
+def prune_meetings(keep):
+    """Delete all but the newest `keep` meetings; return the removed IDs, or [] on error."""
+    try:
+        with _lock:
+            conn = _connection()
+            conn.execute("BEGIN")
+            try:
+                rows = conn.execute(
+                    "SELECT meeting_id FROM meetings ORDER BY timestamp DESC LIMIT -1 OFFSET ?",
+                    (keep,)
+                ).fetchall()
+                removed = [row[0] for row in rows]
+                conn.executemany("DELETE FROM meetings WHERE meeting_id = ?", rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    except Exception as e:
+        logger.error(f"Error pruning stored meetings: {str(e)}")
+        return []
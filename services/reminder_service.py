@@ -2,163 +2,320 @@
 Service for sending reminders and notifications to team members.
 """
 
+import bisect
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from config import dev_tasks, JIRA_HOST
-from services.jira_service import update_jira_ticket, get_issue
+from services.jira_service import update_jira_ticket, get_issue, get_issues
+from services.task_store import store_tasks, load_tasks
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Secondary index of task_id -> (developer_id, position in that developer's list),
+# so a task is found without scanning every developer's tasks
+_task_index = {}
+_task_lock = threading.Lock()
+
+# Pending tasks per developer in creation order, {developer_id: {task_id: task}},
+# kept up to date on every status change so queries skip non-pending tasks
+_pending_by_dev = {}
+
+# Pending tasks with a due date, sorted by it, as two parallel columns: the due
+# dates alone are bisected, and the (developer_id, task) rows are only touched
+# for the matching slice
+_pending_due_dates = []
+_pending_due_rows = []
+
+# Upper bound on concurrent bot messages when sending reminders
+_MAX_SEND_WORKERS = 16
+
+# Prefix of JIRA issue links, built once instead of per task
+_JIRA_BROWSE_PREFIX = f"{JIRA_HOST}/browse/"
+
+# Instructions closing each reminder; only the bot ID ({0}) varies
+_REMINDER_FOOTER = (
+    "\n"
+    "**To update a task status, reply with:**\n"
+    "`![:Person]({0}) update-task TASK_ID status: completed`\n\n"
+    "Need help? Reply with:\n"
+    "`![:Person]({0}) help`"
+)
+_OVERDUE_FOOTER = (
+    "\n"
+    "Please update these tasks as soon as possible.\n\n"
+    "To mark a task as complete, reply with:\n"
+    "`![:Person]({0}) update-task TASK_ID status: completed`"
+)
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(timestamp):
+    """Parse an ISO timestamp; task dates are re-read on every listing and reminder."""
+    return datetime.fromisoformat(timestamp)
+
+def _mark_pending(developer_id, task):
+    """Add a task to the pending indexes. Call with _task_lock held."""
+    _pending_by_dev.setdefault(developer_id, {})[task["task_id"]] = task
+    if task.get("due_date"):
+        due_date = _parse_iso(task["due_date"])
+        # Insert after equal due dates so ties stay in the order they were added
+        i = bisect.bisect_right(_pending_due_dates, due_date)
+        _pending_due_dates.insert(i, due_date)
+        _pending_due_rows.insert(i, (developer_id, task))
+
+def _unmark_pending(developer_id, task):
+    """Remove a task from the pending indexes. Call with _task_lock held."""
+    _pending_by_dev.get(developer_id, {}).pop(task["task_id"], None)
+    if task.get("due_date"):
+        due_date = _parse_iso(task["due_date"])
+        lo = bisect.bisect_left(_pending_due_dates, due_date)
+        hi = bisect.bisect_right(_pending_due_dates, due_date, lo)
+        for i in range(lo, hi):
+            if _pending_due_rows[i][1] is task:
+                del _pending_due_dates[i]
+                del _pending_due_rows[i]
+                break
+
+def _register_task(developer_id, task):
+    """Append a task to its developer's list and the indexes. Call with _task_lock held."""
+    tasks = dev_tasks.setdefault(developer_id, [])
+    # Where the task lives in the store: its developer and list position
+    task["_store_key"] = (developer_id, len(tasks))
+    tasks.append(task)
+    # IDs only have second resolution, so keep the first task registered
+    # under an ID, which is the one a full scan would have found
+    if task["task_id"] not in _task_index:
+        _task_index[task["task_id"]] = (developer_id, len(tasks) - 1)
+    if task.get("status") == "pending":
+        _mark_pending(developer_id, task)
+
+def _persist(*tasks):
+    """Write tasks through to the task store so they survive a restart."""
+    store_tasks([(*task["_store_key"], task) for task in tasks])
+
+# Issue fields copied onto tasks linked to a JIRA ticket
+_JIRA_TASK_FIELDS = ("summary", "status", "assignee")
+
+def _apply_issue_fields(task, issue):
+    """Copy a JIRA issue's summary, status and assignee onto a task; return True if any changed."""
+    fields = issue.get("fields", {})
+    details = {
+        "jira_summary": fields.get("summary", ""),
+        "jira_status": (fields.get("status") or {}).get("name", ""),
+        "jira_assignee": (fields.get("assignee") or {}).get("displayName", "")
+    }
+    changed = any(task.get(key) != value for key, value in details.items())
+    task.update(details)
+    return changed
+
+def _jira_link(task):
+    """Markdown link to a task's JIRA ticket, or an empty string if it has none."""
+    ticket = task.get("jira_ticket")
+    if not ticket:
+        return ""
+    return f" [JIRA: {ticket}]({task.get('jira_url') or _JIRA_BROWSE_PREFIX + ticket})"
+
+def _line_tail(task):
+    """The static end of a task's reminder line: its JIRA link and ID."""
+    tail = task.get("_line_tail")
+    if tail is None:
+        tail = f"{_jira_link(task)} (ID: {task['task_id']})\n"
+    return tail
+
+@functools.lru_cache(maxsize=None)
+def _chat_id_for(developer_id):
+    """Chat to send a developer's reminders to, built once per developer."""
+    # In a real implementation, you would get the developer's chat ID
+    return f"direct:{developer_id}"  # This will need to be adjusted for actual implementation
+
 def track_developer_task(developer_id, task_description, jira_ticket=None, due_date=None):
     """Add a task for a developer to track."""
-    if developer_id not in dev_tasks:
-        dev_tasks[developer_id] = []
+    # setdefault is a single dict operation, so concurrent first tasks for a
+    # developer cannot each install their own list
+    tasks = dev_tasks.setdefault(developer_id, [])
     
     # Create a unique task ID
-    task_id = f"task-{len(dev_tasks[developer_id]) + 1}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    task_id = f"task-{len(tasks) + 1}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
     
     # Add the task
+    created_at = datetime.now()
     task = {
         "task_id": task_id,
         "description": task_description,
         "jira_ticket": jira_ticket,
-        "created_at": datetime.now().isoformat(),
+        "created_at": created_at.isoformat(),
         "due_date": due_date.isoformat() if due_date else None,
         "status": "pending",
         "reminder_sent": False,
-        "last_reminder": None
+        "last_reminder": None,
+        # Due and creation dates never change, so their sort key is built once
+        "_sort_key": (due_date or datetime.max, created_at)
     }
     
-    # If this is a JIRA ticket, get more details
+    # If this is a JIRA ticket, link it and get more details
     if jira_ticket:
+        task["jira_url"] = _JIRA_BROWSE_PREFIX + jira_ticket
         try:
             issue = get_issue(jira_ticket)
             if issue:
-                fields = issue.get("fields", {})
-                task["jira_summary"] = fields.get("summary", "")
-                task["jira_status"] = fields.get("status", {}).get("name", "")
-                task["jira_assignee"] = fields.get("assignee", {}).get("displayName", "")
-                task["jira_url"] = f"{JIRA_HOST}/browse/{jira_ticket}"
+                _apply_issue_fields(task, issue)
         except Exception as e:
             logger.error(f"Error getting JIRA ticket details for {jira_ticket}: {str(e)}")
     
-    dev_tasks[developer_id].append(task)
+    # The end of the task's reminder line never changes, so render it once
+    task["_line_tail"] = _line_tail(task)
+    
+    with _task_lock:
+        _register_task(developer_id, task)
+    _persist(task)
     
     logger.info(f"Task {task_id} added for developer {developer_id}")
     return task_id
 
 def update_task_status(task_id, status):
     """Update the status of a task."""
-    for developer_id, tasks in dev_tasks.items():
-        for i, task in enumerate(tasks):
-            if task.get("task_id") == task_id:
-                old_status = task.get("status")
-                dev_tasks[developer_id][i]["status"] = status
-                dev_tasks[developer_id][i]["updated_at"] = datetime.now().isoformat()
-                logger.info(f"Task {task_id} status updated from {old_status} to {status}")
-                
-                # If task is linked to a JIRA ticket and status is completed, update JIRA
-                if (status.lower() in ("done", "completed", "finished") and 
-                    task.get("jira_ticket") and 
-                    old_status.lower() != status.lower()):
-                    try:
-                        # Map task status to JIRA status
-                        jira_status = "Done"  # Default mapping
-                        if status.lower() == "in progress":
-                            jira_status = "In Progress"
-                        elif status.lower() in ("todo", "to do", "new"):
-                            jira_status = "To Do"
-                        
-                        # Update the JIRA ticket
-                        update_result = update_jira_ticket(
-                            ticket_key=task["jira_ticket"],
-                            status=jira_status,
-                            comment=f"Task status updated to {status} via ScrumMaster AI"
-                        )
-                        
-                        if update_result:
-                            logger.info(f"JIRA ticket {task['jira_ticket']} updated to {jira_status}")
-                            
-                            # Update the task with the latest JIRA status
-                            issue = get_issue(task["jira_ticket"])
-                            if issue:
-                                fields = issue.get("fields", {})
-                                dev_tasks[developer_id][i]["jira_status"] = fields.get("status", {}).get("name", "")
-                        else:
-                            logger.error(f"Failed to update JIRA ticket {task['jira_ticket']}")
-                    except Exception as e:
-                        logger.error(f"Error updating JIRA ticket {task['jira_ticket']}: {str(e)}")
+    developer_id, i = _task_index.get(task_id, (None, None))
+    if developer_id is None:
+        logger.warning(f"Task {task_id} not found")
+        return False
+        
+    task = dev_tasks[developer_id][i]
+    # Read the old status under the lock too, so two concurrent updates cannot
+    # both see "pending" and unmark the task twice
+    with _task_lock:
+        old_status = task.get("status")
+        task["status"] = status
+        task["updated_at"] = datetime.now().isoformat()
+        if old_status == "pending" and status != "pending":
+            _unmark_pending(developer_id, task)
+        elif old_status != "pending" and status == "pending":
+            _mark_pending(developer_id, task)
+    _persist(task)
+    logger.info(f"Task {task_id} status updated from {old_status} to {status}")
+    
+    # If task is linked to a JIRA ticket and status is completed, update JIRA
+    if (status.lower() in ("done", "completed", "finished") and 
+        task.get("jira_ticket") and 
+        old_status.lower() != status.lower()):
+        try:
+            # Map task status to JIRA status
+            jira_status = "Done"  # Default mapping
+            if status.lower() == "in progress":
+                jira_status = "In Progress"
+            elif status.lower() in ("todo", "to do", "new"):
+                jira_status = "To Do"
+            
+            # Update the JIRA ticket
+            update_result = update_jira_ticket(
+                ticket_key=task["jira_ticket"],
+                status=jira_status,
+                comment=f"Task status updated to {status} via ScrumMaster AI"
+            )
+            
+            if update_result:
+                logger.info(f"JIRA ticket {task['jira_ticket']} updated to {jira_status}")
                 
-                return True
+                # Update the task with the latest JIRA status
+                issue = get_issue(task["jira_ticket"])
+                if issue:
+                    fields = issue.get("fields", {})
+                    task["jira_status"] = fields.get("status", {}).get("name", "")
+                    _persist(task)
+            else:
+                logger.error(f"Failed to update JIRA ticket {task['jira_ticket']}")
+        except Exception as e:
+            logger.error(f"Error updating JIRA ticket {task['jira_ticket']}: {str(e)}")
     
-    logger.warning(f"Task {task_id} not found")
-    return False
+    return True
 
 def get_developer_tasks(developer_id):
     """Get all tasks for a developer."""
     tasks = dev_tasks.get(developer_id, [])
     
-    # Sort tasks - pending first, then by due date
+    # Sort tasks - pending first, then by due date, then by creation date
     sorted_tasks = sorted(
         tasks,
-        key=lambda t: (
-            0 if t.get("status") == "pending" else 1,  # Pending tasks first
-            datetime.fromisoformat(t.get("due_date")) if t.get("due_date") else datetime.max,  # Then by due date
-            datetime.fromisoformat(t.get("created_at"))  # Then by creation date
-        )
+        key=lambda t: (t.get("status") != "pending", t["_sort_key"])
     )
     
     return sorted_tasks
 
 def get_pending_tasks(developer_id=None):
     """Get pending tasks, optionally filtered by developer."""
-    if developer_id:
-        return [t for t in dev_tasks.get(developer_id, []) if t.get("status") == "pending"]
+    # Snapshot under the lock so a concurrent status change cannot resize the
+    # dicts while they are being read
+    with _task_lock:
+        if developer_id:
+            return list(_pending_by_dev.get(developer_id, {}).values())
+        pending_rows = [
+            (dev_id, task) for dev_id, pending in _pending_by_dev.items() for task in pending.values()
+        ]
     
     # Get all pending tasks across all developers
     all_pending = []
-    for dev_id, tasks in dev_tasks.items():
-        pending = [t for t in tasks if t.get("status") == "pending"]
-        for task in pending:
-            task_copy = task.copy()
-            task_copy["developer_id"] = dev_id
-            all_pending.append(task_copy)
-    
-    # Sort by due date
-    sorted_pending = sorted(
-        all_pending,
-        key=lambda t: (
-            datetime.fromisoformat(t.get("due_date")) if t.get("due_date") else datetime.max,
-            datetime.fromisoformat(t.get("created_at"))
-        )
-    )
+    for dev_id, task in pending_rows:
+        task_copy = task.copy()
+        task_copy["developer_id"] = dev_id
+        all_pending.append(task_copy)
+    
+    # Sort by due date, then by creation date
+    sorted_pending = sorted(all_pending, key=lambda t: t["_sort_key"])
     
     return sorted_pending
 
 def get_overdue_tasks():
     """Get tasks that are overdue (past due date and still pending)."""
     now = datetime.now()
+    
+    # Pending tasks are kept sorted by due date (most overdue first), so the
+    # overdue ones are the prefix due before now
+    with _task_lock:
+        end = bisect.bisect_left(_pending_due_dates, now)
+        overdue_rows = _pending_due_rows[:end]
+    
     overdue_tasks = []
+    for developer_id, task in overdue_rows:
+        task_copy = task.copy()
+        task_copy["developer_id"] = developer_id
+        overdue_tasks.append(task_copy)
     
-    for developer_id, tasks in dev_tasks.items():
-        for task in tasks:
-            if (task.get("status") == "pending" and 
-                task.get("due_date") and 
-                datetime.fromisoformat(task["due_date"]) < now):
-                
-                task_copy = task.copy()
-                task_copy["developer_id"] = developer_id
-                overdue_tasks.append(task_copy)
-    
-    # Sort by most overdue first
-    sorted_overdue = sorted(
-        overdue_tasks,
-        key=lambda t: datetime.fromisoformat(t.get("due_date"))
-    )
+    return overdue_tasks
+
+def _send_daily_reminder(bot, developer_id, tasks_to_remind, now_iso):
+    """Send one developer's daily reminder and mark its tasks; return True if it was sent."""
+    try:
+        # Format the reminder message
+        reminder = format_reminder_message(developer_id, tasks_to_remind, bot.id)
+        
+        chat_id = _chat_id_for(developer_id)
+        
+        try:
+            # Send message
+            bot.sendMessage(
+                chat_id,
+                {
+                    'text': reminder
+                }
+            )
+            
+            # Update reminder status; tasks_to_remind holds the stored task dicts
+            for task in tasks_to_remind:
+                task["reminder_sent"] = True
+                task["last_reminder"] = now_iso
+            _persist(*tasks_to_remind)
+            
+            logger.info(f"Reminder sent to developer {developer_id} for {len(tasks_to_remind)} tasks")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send message: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error preparing reminder for {developer_id}: {str(e)}")
     
-    return sorted_overdue
+    return False
 
 def send_daily_reminders(bot=None):
     """Send daily reminders to developers about their pending tasks."""
@@ -167,12 +324,19 @@ def send_daily_reminders(bot=None):
         "developers_notified": []
     }
     
+    if not bot:
+        return results
+    
     now = datetime.now()
+    now_iso = now.isoformat()
+    remind_before = now - timedelta(hours=24)
     
-    for developer_id, tasks in dev_tasks.items():
-        # Get tasks that are pending
-        pending_tasks = [t for t in tasks if t.get("status") == "pending"]
-        
+    # Snapshot the pending index so tasks tracked meanwhile do not disturb the loop
+    with _task_lock:
+        pending_by_dev = [(dev_id, list(pending.values())) for dev_id, pending in _pending_by_dev.items()]
+    
+    reminders = []
+    for developer_id, pending_tasks in pending_by_dev:
         # Filter for tasks that:
         # 1. Have never had a reminder sent OR
         # 2. Last reminder was more than 24 hours ago
@@ -180,127 +344,96 @@ def send_daily_reminders(bot=None):
             t for t in pending_tasks if (
                 not t.get("reminder_sent") or
                 (t.get("last_reminder") and 
-                 now - datetime.fromisoformat(t["last_reminder"]) > timedelta(hours=24))
+                 _parse_iso(t["last_reminder"]) < remind_before)
             )
         ]
         
-        if tasks_to_remind and bot:
-            try:
-                # Format the reminder message
-                reminder = format_reminder_message(developer_id, tasks_to_remind, bot.id)
-                
-                # In a real implementation, you would get the developer's chat ID
-                # For now, we'll just use the group chat ID
-                chat_id = f"direct:{developer_id}"  # This will need to be adjusted for actual implementation
-                
-                try:
-                    # Send message
-                    bot.sendMessage(
-                        chat_id,
-                        {
-                            'text': reminder
-                        }
-                    )
-                    
-                    # Update reminder status
-                    for task in tasks_to_remind:
-                        task_index = next((i for i, t in enumerate(tasks) if t["task_id"] == task["task_id"]), -1)
-                        if task_index >= 0:
-                            dev_tasks[developer_id][task_index]["reminder_sent"] = True
-                            dev_tasks[developer_id][task_index]["last_reminder"] = now.isoformat()
-                    
-                    results["reminders_sent"] += 1
-                    results["developers_notified"].append(developer_id)
-                    
-                    logger.info(f"Reminder sent to developer {developer_id} for {len(tasks_to_remind)} tasks")
-                except Exception as e:
-                    logger.error(f"Failed to send message: {str(e)}")
-            except Exception as e:
-                logger.error(f"Error preparing reminder for {developer_id}: {str(e)}")
+        if tasks_to_remind:
+            reminders.append((developer_id, tasks_to_remind))
+    
+    if not reminders:
+        return results
+        
+    # Each message is an independent round-trip, so send them concurrently;
+    # results are collected in submission order to keep the report stable
+    with ThreadPoolExecutor(max_workers=min(_MAX_SEND_WORKERS, len(reminders))) as executor:
+        futures = [
+            (developer_id, executor.submit(_send_daily_reminder, bot, developer_id, tasks_to_remind, now_iso))
+            for developer_id, tasks_to_remind in reminders
+        ]
+        for developer_id, future in futures:
+            if future.result():
+                results["reminders_sent"] += 1
+                results["developers_notified"].append(developer_id)
     
     return results
 
+@functools.lru_cache(maxsize=512)
+def _render_reminder(bot_id, overdue, due_today, upcoming):
+    """Render a daily reminder from rows of already-classified tasks.
+
+    overdue rows are (description, days_overdue, line_tail), due_today rows are
+    (description, line_tail), and upcoming rows are (description, days_left or
+    None, line_tail). Rows are plain tuples so an unchanged reminder is served
+    from the cache.
+    """
+    parts = [
+        "**Daily Task Reminder**\n\n",
+        f"You have {len(overdue) + len(due_today) + len(upcoming)} pending tasks:\n\n"
+    ]
+    
+    # Format overdue tasks
+    if overdue:
+        parts.append("**Overdue Tasks:**\n")
+        for i, (description, days_overdue, tail) in enumerate(overdue, 1):
+            parts.append(f"{i}. {description} **OVERDUE by {days_overdue} days**{tail}")
+        parts.append("\n")
+    
+    # Format tasks due today
+    if due_today:
+        parts.append("**Due Today:**\n")
+        for i, (description, tail) in enumerate(due_today, 1):
+            parts.append(f"{i}. {description}{tail}")
+        parts.append("\n")
+    
+    # Format upcoming tasks
+    if upcoming:
+        parts.append("**Upcoming Tasks:**\n")
+        for i, (description, days_left, tail) in enumerate(upcoming, 1):
+            due_text = f" (Due in {days_left} days)" if days_left is not None else ""
+            parts.append(f"{i}. {description}{due_text}{tail}")
+    
+    # Add instructions
+    parts.append(_REMINDER_FOOTER.format(bot_id))
+    
+    return "".join(parts)
+
 def format_reminder_message(developer_id, tasks, bot_id):
     """Format a reminder message for a developer."""
-    message = f"**Daily Task Reminder**\n\n"
-    message += f"You have {len(tasks)} pending tasks:\n\n"
-    
     # Group tasks by status (overdue, due today, upcoming)
     now = datetime.now()
     today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     tomorrow = today + timedelta(days=1)
     
-    overdue_tasks = []
-    due_today_tasks = []
-    upcoming_tasks = []
+    overdue = []
+    due_today = []
+    upcoming = []
     
     for task in tasks:
+        description = task["description"]
+        tail = _line_tail(task)
         if task.get("due_date"):
-            due_date = datetime.fromisoformat(task["due_date"])
+            due_date = _parse_iso(task["due_date"])
             if due_date < today:
-                overdue_tasks.append(task)
+                overdue.append((description, (now - due_date).days, tail))
             elif due_date < tomorrow:
-                due_today_tasks.append(task)
+                due_today.append((description, tail))
             else:
-                upcoming_tasks.append(task)
+                upcoming.append((description, (due_date - now).days, tail))
         else:
-            upcoming_tasks.append(task)
-    
-    # Format overdue tasks
-    if overdue_tasks:
-        message += "**Overdue Tasks:**\n"
-        for i, task in enumerate(overdue_tasks, 1):
-            created = datetime.fromisoformat(task["created_at"]).strftime("%Y-%m-%d")
-            due_date = datetime.fromisoformat(task["due_date"])
-            days_overdue = (now - due_date).days
-            
-            jira_text = ""
-            if task.get("jira_ticket"):
-                jira_url = f"{JIRA_HOST}/browse/{task['jira_ticket']}"
-                jira_text = f" [JIRA: {task['jira_ticket']}]({jira_url})"
-            
-            message += f"{i}. {task['description']} **OVERDUE by {days_overdue} days**{jira_text} (ID: {task['task_id']})\n"
-        message += "\n"
-    
-    # Format tasks due today
-    if due_today_tasks:
-        message += "**Due Today:**\n"
-        for i, task in enumerate(due_today_tasks, 1):
-            jira_text = ""
-            if task.get("jira_ticket"):
-                jira_url = f"{JIRA_HOST}/browse/{task['jira_ticket']}"
-                jira_text = f" [JIRA: {task['jira_ticket']}]({jira_url})"
-            
-            message += f"{i}. {task['description']}{jira_text} (ID: {task['task_id']})\n"
-        message += "\n"
+            upcoming.append((description, None, tail))
     
-    # Format upcoming tasks
-    if upcoming_tasks:
-        message += "**Upcoming Tasks:**\n"
-        for i, task in enumerate(upcoming_tasks, 1):
-            created = datetime.fromisoformat(task["created_at"]).strftime("%Y-%m-%d")
-            
-            due_text = ""
-            if task.get("due_date"):
-                due_date = datetime.fromisoformat(task["due_date"])
-                days_left = (due_date - now).days
-                due_text = f" (Due in {days_left} days)"
-            
-            jira_text = ""
-            if task.get("jira_ticket"):
-                jira_url = f"{JIRA_HOST}/browse/{task['jira_ticket']}"
-                jira_text = f" [JIRA: {task['jira_ticket']}]({jira_url})"
-            
-            message += f"{i}. {task['description']}{due_text}{jira_text} (ID: {task['task_id']})\n"
-    
-    # Add instructions
-    message += "\n"
-    message += "**To update a task status, reply with:**\n"
-    message += f"`![:Person]({bot_id}) update-task TASK_ID status: completed`\n\n"
-    message += "Need help? Reply with:\n"
-    message += f"`![:Person]({bot_id}) help`"
-    
-    return message
+    return _render_reminder(bot_id, tuple(overdue), tuple(due_today), tuple(upcoming))
 
 def sync_tasks_with_jira(developer_id=None):
     """Sync developer tasks with JIRA tickets assigned to them."""
@@ -310,14 +443,31 @@ def sync_tasks_with_jira(developer_id=None):
         "errors": []
     }
     
-    # This is a placeholder implementation
-    # In a real implementation, you would:
-    # 1. Query JIRA for assigned tickets for the developer
-    # 2. Compare with the tasks in dev_tasks
-    # 3. Add new tickets as tasks
-    # 4. Update existing tasks based on ticket status
-    
-    logger.info("Task syncing with JIRA is not yet implemented")
+    # Refresh every linked task from JIRA, fetching all tickets in batched searches
+    with _task_lock:
+        if developer_id:
+            tasks = list(dev_tasks.get(developer_id, []))
+        else:
+            tasks = [task for dev_list in dev_tasks.values() for task in dev_list]
+    linked = [task for task in tasks if task.get("jira_ticket")]
+    
+    if linked:
+        issues = get_issues([task["jira_ticket"] for task in linked], fields=_JIRA_TASK_FIELDS)
+        changed = []
+        for task in linked:
+            issue = issues.get(task["jira_ticket"])
+            if issue is None:
+                results["errors"].append(f"Could not load {task['jira_ticket']} for task {task['task_id']}")
+            elif _apply_issue_fields(task, issue):
+                changed.append(task)
+        results["tasks_updated"] = len(changed)
+        if changed:
+            _persist(*changed)
+    
+    # Adding newly assigned tickets as tasks needs a mapping from chat users to
+    # JIRA accounts, which the bot does not have yet
+    
+    logger.info(f"Synced {len(linked)} JIRA-linked tasks, {results['tasks_updated']} updated")
     return results
 
 def check_inactive_tickets():
@@ -333,6 +483,38 @@ def check_inactive_tickets():
     logger.info("Inactive ticket checking is not yet implemented")
     return results
 
+def _send_overdue_reminder(bot, dev_id, tasks, now):
+    """Send one developer's overdue-task reminder; return True if it was sent."""
+    try:
+        # Format the message
+        parts = [
+            "**⚠️ OVERDUE TASKS REMINDER ⚠️**\n\n",
+            f"You have {len(tasks)} overdue tasks that need immediate attention:\n\n"
+        ]
+        
+        for i, task in enumerate(tasks, 1):
+            days_overdue = (now - _parse_iso(task["due_date"])).days
+            parts.append(f"{i}. {task['description']} **OVERDUE by {days_overdue} days**{_line_tail(task)}")
+        
+        parts.append(_OVERDUE_FOOTER.format(bot.id))
+        message = "".join(parts)
+        
+        # Send the message
+        chat_id = _chat_id_for(dev_id)
+        
+        bot.sendMessage(
+            chat_id,
+            {
+                'text': message
+            }
+        )
+        
+        logger.info(f"Overdue reminder sent to developer {dev_id} for {len(tasks)} tasks")
+        return True
+    except Exception as e:
+        logger.error(f"Error sending overdue reminder to {dev_id}: {str(e)}")
+        return False
+
 def send_overdue_reminders(bot=None):
     """Send reminders specifically for overdue tasks."""
     results = {
@@ -353,46 +535,30 @@ def send_overdue_reminders(bot=None):
             dev_overdue[dev_id] = []
         dev_overdue[dev_id].append(task)
     
-    # Send reminders to each developer
-    for dev_id, tasks in dev_overdue.items():
-        try:
-            # Format the message
-            message = "**⚠️ OVERDUE TASKS REMINDER ⚠️**\n\n"
-            message += f"You have {len(tasks)} overdue tasks that need immediate attention:\n\n"
-            
-            for i, task in enumerate(tasks, 1):
-                created = datetime.fromisoformat(task["created_at"]).strftime("%Y-%m-%d")
-                due_date = datetime.fromisoformat(task["due_date"])
-                now = datetime.now()
-                days_overdue = (now - due_date).days
-                
-                jira_text = ""
-                if task.get("jira_ticket"):
-                    jira_url = f"{JIRA_HOST}/browse/{task['jira_ticket']}"
-                    jira_text = f" [JIRA: {task['jira_ticket']}]({jira_url})"
-                
-                message += f"{i}. {task['description']} **OVERDUE by {days_overdue} days**{jira_text} (ID: {task['task_id']})\n"
-            
-            message += "\n"
-            message += "Please update these tasks as soon as possible.\n\n"
-            message += "To mark a task as complete, reply with:\n"
-            message += f"`![:Person]({bot.id}) update-task TASK_ID status: completed`"
-            
-            # Send the message
-            chat_id = f"direct:{dev_id}"  # This will need to be adjusted for actual implementation
-            
-            bot.sendMessage(
-                chat_id,
-                {
-                    'text': message
-                }
-            )
-            
-            results["reminders_sent"] += 1
-            results["tasks_reminded"].extend([t["task_id"] for t in tasks])
-            
-            logger.info(f"Overdue reminder sent to developer {dev_id} for {len(tasks)} tasks")
-        except Exception as e:
-            logger.error(f"Error sending overdue reminder to {dev_id}: {str(e)}")
+    if not dev_overdue:
+        return results
+        
+    # Send reminders to each developer concurrently, collecting results in order
+    now = datetime.now()
+    with ThreadPoolExecutor(max_workers=min(_MAX_SEND_WORKERS, len(dev_overdue))) as executor:
+        futures = [
+            (tasks, executor.submit(_send_overdue_reminder, bot, dev_id, tasks, now))
+            for dev_id, tasks in dev_overdue.items()
+        ]
+        for tasks, future in futures:
+            if future.result():
+                results["reminders_sent"] += 1
+                results["tasks_reminded"].extend([t["task_id"] for t in tasks])
     
-    return results
\ No newline at end of file
+    return results
+
+def _warm_task_cache():
+    """Load stored tasks into dev_tasks and rebuild the in-memory indexes at startup."""
+    with _task_lock:
+        for developer_id, task in load_tasks():
+            due_date = _parse_iso(task["due_date"]) if task.get("due_date") else None
+            task["_sort_key"] = (due_date or datetime.max, _parse_iso(task["created_at"]))
+            task["_line_tail"] = _line_tail(task)
+            _register_task(developer_id, task)
+
+_warm_task_cache()
@@ -0,0 +1,85 @@
+"""
+Full-text index over recorded meetings, backed by SQLite FTS5.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from config import DATA_DIR
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Where the index lives; it is kept next to the meeting store so the two stay
+# in step across restarts (':memory:' keeps it for the process lifetime only)
+MEETING_INDEX_PATH = os.environ.get('MEETING_INDEX_PATH', os.path.join(DATA_DIR, 'meeting_index.db'))
+
+_conn = None
+_lock = threading.Lock()
+
+def _connection():
+    """Open the index on first use and create the FTS table if needed."""
+    global _conn
+    if _conn is None:
+        if MEETING_INDEX_PATH != ':memory:':
+            os.makedirs(os.path.dirname(MEETING_INDEX_PATH) or '.', exist_ok=True)
+        conn = sqlite3.connect(MEETING_INDEX_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS meetings USING fts5("
+            "meeting_id UNINDEXED, timestamp UNINDEXED, transcript, summary_json, "
+            "tokenize='porter unicode61')"
+        )
+        _conn = conn
+    return _conn
+
+def _phrase(topic):
+    """Quote a topic as a single FTS phrase so its punctuation is not parsed as query syntax."""
+    return '"' + topic.replace('"', '""') + '"'
+
+def index_meeting(meeting_id, timestamp, transcript, summary):
+    """Add a meeting to the full-text index."""
+    try:
+        with _lock:
+            conn = _connection()
+            conn.execute(
+                "INSERT INTO meetings (meeting_id, timestamp, transcript, summary_json) VALUES (?, ?, ?, ?)",
+                (meeting_id, timestamp, transcript, json.dumps(summary, ensure_ascii=False))
+            )
+            conn.commit()
+        return True
+
+    except Exception as e:
+        logger.error(f"Error indexing meeting {meeting_id}: {str(e)}")
+        return False
+
+def remove_meetings(meeting_ids):
+    """Drop meetings from the full-text index."""
+    try:
+        with _lock:
+            conn = _connection()
+            conn.executemany("DELETE FROM meetings WHERE meeting_id = ?", [(meeting_id,) for meeting_id in meeting_ids])
+            conn.commit()
+        return True
+
+    except Exception as e:
+        logger.error(f"Error removing meetings from the index: {str(e)}")
+        return False
+
+def search_meetings(topic):
+    """Return (meeting_id, timestamp) rows mentioning a topic, oldest first.
+
+    Returns None if the index cannot be queried, so callers can fall back to a scan.
+    """
+    try:
+        with _lock:
+            return _connection().execute(
+                "SELECT meeting_id, timestamp FROM meetings WHERE meetings MATCH ? ORDER BY rowid",
+                (_phrase(topic),)
+            ).fetchall()
+
+    except Exception as e:
+        logger.error(f"Error searching meeting index: {str(e)}")
+        return None
@@ -0,0 +1,97 @@
+"""
+Durable storage for tracked developer tasks, backed by SQLite.
+
+dev_tasks in config stays as the in-memory working set; every change to a task
+is written through to this store so tasks survive a restart.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from config import DATA_DIR
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Where tasks are stored; a file keeps them across restarts (':memory:' keeps
+# them for the process lifetime only)
+TASK_STORE_PATH = os.environ.get('TASK_STORE_PATH', os.path.join(DATA_DIR, 'tasks.db'))
+
+_conn = None
+_lock = threading.Lock()
+
+def _connection():
+    """Open the store on first use and create the table if needed."""
+    global _conn
+    if _conn is None:
+        if TASK_STORE_PATH != ':memory:':
+            os.makedirs(os.path.dirname(TASK_STORE_PATH) or '.', exist_ok=True)
+        conn = sqlite3.connect(TASK_STORE_PATH, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Task IDs only have second resolution and can repeat, so a task is
+        # keyed by its developer and its position in that developer's list
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "developer_id TEXT NOT NULL, position INTEGER NOT NULL, task_id TEXT NOT NULL, "
+            "status TEXT, due_date TEXT, task_json TEXT NOT NULL, "
+            "PRIMARY KEY (developer_id, position))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS tasks_developer_status ON tasks (developer_id, status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS tasks_status_due ON tasks (status, due_date)")
+        _conn = conn
+    return _conn
+
+def _row(developer_id, position, task):
+    """Column values for a task; private in-memory fields (leading underscore) are not stored."""
+    public = {key: value for key, value in task.items() if not key.startswith("_")}
+    return (
+        developer_id, position, task["task_id"], task.get("status"), task.get("due_date"),
+        json.dumps(public)
+    )
+
+def store_tasks(rows):
+    """Save (developer_id, position, task) rows in one transaction; return True on success."""
+    try:
+        values = [_row(*row) for row in rows]
+        with _lock:
+            conn = _connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tasks (developer_id, position, task_id, status, due_date, task_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    values
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return True
+
+    except Exception as e:
+        logger.error(f"Error storing tasks: {str(e)}")
+        return False
+
+def store_task(developer_id, position, task):
+    """Save one task at its position in a developer's list; return True on success."""
+    return store_tasks([(developer_id, position, task)])
+
+def load_tasks():
+    """Return every stored task as (developer_id, task) pairs in each developer's order.
+
+    Returns an empty list if the store is unavailable.
+    """
+    try:
+        with _lock:
+            rows = _connection().execute(
+                "SELECT developer_id, task_json FROM tasks ORDER BY developer_id, position"
+            ).fetchall()
+        return [(developer_id, json.loads(task_json)) for developer_id, task_json in rows]
+
+    except Exception as e:
+        logger.error(f"Error loading tasks: {str(e)}")
+        return []
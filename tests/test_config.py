@@ -0,0 +1,36 @@
+"""
+Tests for bot command parsing.
+"""
+
+import unittest
+
+from config import _parse_kv
+
+
+class ParseKeyValueTest(unittest.TestCase):
+
+    def test_log_time_without_comma(self):
+        # The form documented in the help text separates keys by whitespace only
+        params = _parse_kv("![:Person](123) log-time ABC-1 hours: 2 comment: fixed bug")
+        self.assertEqual(params, {"hours": "2", "comment": "fixed bug"})
+
+    def test_comma_separated_pairs(self):
+        params = _parse_kv("![:Person](123) log-time ABC-1 hours: 1.5, comment: fixed bug")
+        self.assertEqual(params, {"hours": "1.5", "comment": "fixed bug"})
+
+    def test_multi_word_value(self):
+        params = _parse_kv("![:Person](123) update-task task-1 status: in progress")
+        self.assertEqual(params, {"status": "in progress"})
+
+    def test_time_of_day_value(self):
+        # A colon inside a value is not the start of another key
+        params = _parse_kv("![:Person](123) update-ticket ABC-1 comment: standup moved to 10:30 tomorrow")
+        self.assertEqual(params, {"comment": "standup moved to 10:30 tomorrow"})
+
+    def test_url_value(self):
+        params = _parse_kv("![:Person](123) add-task description: see https://x.io/a for details due: 2024-05-01")
+        self.assertEqual(params, {"description": "see https://x.io/a for details", "due": "2024-05-01"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,22 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Type, Dict
+from typing import List, Type, Dict, Optional
+from pydantic import BaseModel
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, case
+from sqlalchemy.pool import QueuePool
 import chromadb
 from chromadb.config import Settings
+import asyncio, aiohttp, threading
+from collections import OrderedDict
 import openai, os, json, random, re, requests
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the standard json module
+    orjson = None
 from sentence_transformers import SentenceTransformer
 from datetime import datetime, timezone
-from openai import OpenAI
+from openai import AsyncOpenAI
 from models import (
     Base, Agent, Supervisor, Transcript, Task, TaskStatus,
     AgentCreate, SupervisorCreate, AssignRequest, TranscriptCreate,
@@ -36,6 +44,38 @@ SAMPLE_CONVERSATION = (
     "Agent:<2028>I'll set a reminder for the design team to complete the wireframes by EOD Friday."
 )
 
+# HNSW settings for both collections: BGE embeddings are compared by cosine
+# similarity, and a denser graph (M, construction_ef) buys recall and faster
+# queries for a modest amount of index memory
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 64
+}
+
+def open_hnsw_collection(client, name: str):
+    """
+    Return the named collection with HNSW_METADATA, rebuilding it if it was built
+    with another distance space. Chroma fixes a collection's space when it is
+    created and get_or_create_collection would overwrite the stored metadata
+    without touching the index, so an old L2 collection would report cosine.
+    """
+    try:
+        collection = client.get_collection(name)
+    except Exception:
+        return client.create_collection(name, metadata=HNSW_METADATA)
+    if (collection.metadata or {}).get("hnsw:space") == HNSW_METADATA["hnsw:space"]:
+        return collection
+    
+    # Copy the stored embeddings into a new collection built with the wanted space
+    existing = collection.get(include=["embeddings", "metadatas"])
+    client.delete_collection(name)
+    collection = client.create_collection(name, metadata=HNSW_METADATA)
+    if existing["ids"]:
+        collection.add(ids=existing["ids"], embeddings=existing["embeddings"], metadatas=existing["metadatas"])
+    return collection
+
 # Initialize ChromaDB client for tasks
 tasks_chroma_client = chromadb.Client(Settings(
     chroma_db_impl="duckdb+parquet",
@@ -43,7 +83,7 @@ tasks_chroma_client = chromadb.Client(Settings(
 ))
 
 # Create or get a collection for tasks
-task_collection = tasks_chroma_client.get_or_create_collection("tasks")
+task_collection = open_hnsw_collection(tasks_chroma_client, "tasks")
 
 # Initialize ChromaDB client for knowledge base 
 kb_chroma_client = chromadb.Client(Settings(
@@ -52,10 +92,25 @@ kb_chroma_client = chromadb.Client(Settings(
 ))
 
 # Create or get a collection for knowledge base
-kb_collection = kb_chroma_client.get_or_create_collection("kb")
+kb_collection = open_hnsw_collection(kb_chroma_client, "kb")
+
+# Initialize database (SQLite) with a pool of reusable connections; sessions
+# are used from worker threads, so connections may cross threads
+engine = create_engine(
+    "sqlite:///acw.db", echo=False,
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool, pool_size=10
+)
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers proceed while a write is in progress."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
-# Initialize database (SQLite)
-engine = create_engine("sqlite:///acw.db", echo=False)
 SessionLocal = sessionmaker(bind=engine)
 Base.metadata.create_all(bind=engine)
 
@@ -69,8 +124,87 @@ app.add_middleware(
 )
 
 # --- Utilities ---
-# Load the BAAI/bge-small-en model once during application startup
-embedding_model = SentenceTransformer("BAAI/bge-small-en")
+# Load the BAAI/bge-small-en model once during application startup.
+# EMBEDDING_BACKEND=onnx serves it through ONNX Runtime instead of PyTorch;
+# EMBEDDING_ONNX_FILE selects an exported file, e.g. an INT8 model written by
+# sentence_transformers.export_dynamic_quantized_onnx_model. Quantized vectors
+# differ slightly, so rebuild the collections when switching.
+# EMBEDDING_SERVER_URL delegates encoding to a text-embeddings-inference
+# server running the same model, which batches concurrent requests across
+# workers; no model is then loaded in this process.
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE")
+EMBEDDING_SERVER_URL = os.getenv("EMBEDDING_SERVER_URL")
+if EMBEDDING_SERVER_URL:
+    embedding_model = None
+    embedding_http = requests.Session()  # pooled connections to the embedding server
+elif EMBEDDING_BACKEND == "onnx":
+    embedding_model = SentenceTransformer(
+        "BAAI/bge-small-en",
+        backend="onnx",
+        model_kwargs={"file_name": EMBEDDING_ONNX_FILE} if EMBEDDING_ONNX_FILE else None
+    )
+else:
+    embedding_model = SentenceTransformer("BAAI/bge-small-en")
+
+# Number of texts the model encodes per forward pass
+EMBEDDING_BATCH_SIZE = 32
+
+# Recently computed embeddings keyed by their exact text, so task phrases that
+# recur across transcripts skip the model; shared by the worker threads
+EMBEDDING_CACHE_SIZE = 4096
+embedding_cache: "OrderedDict[str, list]" = OrderedDict()
+embedding_cache_lock = threading.Lock()
+
+def encode_texts(texts: List[str]) -> List[list]:
+    """Encode texts with the embedding server if one is configured, else with the local model."""
+    if EMBEDDING_SERVER_URL:
+        embeddings = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            resp = embedding_http.post(
+                f"{EMBEDDING_SERVER_URL}/embed",
+                json={"inputs": texts[start:start + EMBEDDING_BATCH_SIZE]},
+                timeout=60
+            )
+            resp.raise_for_status()
+            embeddings.extend(resp.json())
+        return embeddings
+    embeddings = embedding_model.encode(texts, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True)
+    return embeddings.tolist()  # Convert to lists for compatibility
+
+def get_embeddings(texts: List[str]) -> List[list]:
+    """
+    Generate embeddings for several texts in one batched BAAI/bge-small-en call.
+    Args:
+        texts (List[str]): The input texts to generate embeddings for.
+    Returns:
+        List[list]: One embedding vector (a list of floats) per text, in input order.
+    """
+    if not texts:
+        return []
+    found = {}
+    with embedding_cache_lock:
+        for text in texts:
+            embedding = embedding_cache.get(text)
+            if embedding is not None:
+                embedding_cache.move_to_end(text)
+                found[text] = embedding
+    
+    # Encode each distinct uncached text once
+    missing = list(dict.fromkeys(text for text in texts if text not in found))
+    if missing:
+        try:
+            embeddings = encode_texts(missing)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate embeddings: {e}")
+        with embedding_cache_lock:
+            for text, embedding in zip(missing, embeddings):
+                embedding_cache[text] = embedding
+                found[text] = embedding
+            while len(embedding_cache) > EMBEDDING_CACHE_SIZE:
+                embedding_cache.popitem(last=False)
+    
+    return [found[text] for text in texts]
 
 def get_embedding(text: str) -> list:
     """
@@ -80,19 +214,19 @@ def get_embedding(text: str) -> list:
     Returns:
         list: A list of floats representing the embedding vector.
     """
-    try:
-        # Generate embedding for the input text
-        embedding = embedding_model.encode([text])[0]
-        return embedding.tolist()  # Convert to list for compatibility
-    except Exception as e:
-        raise RuntimeError(f"Failed to generate embedding: {e}")
+    return get_embeddings([text])[0]
 
-def llm_call(prompt: str, response_format: Type[BaseModel]) -> Type[BaseModel]:
-    client = OpenAI(
-    )
+# OpenAI client shared by all requests; created on first use so the app can
+# start without OpenAI credentials
+openai_client: Optional[AsyncOpenAI] = None
+
+async def llm_call(prompt: str, response_format: Type[BaseModel]) -> Type[BaseModel]:
+    global openai_client
+    if openai_client is None:
+        openai_client = AsyncOpenAI()
     model_name = "gpt-4o-mini"
     messages = [{"role": "user", "content": prompt}]
-    completion = client.beta.chat.completions.parse(
+    completion = await openai_client.beta.chat.completions.parse(
         temperature=1,
         messages=messages,
         model=model_name,
@@ -100,25 +234,22 @@ def llm_call(prompt: str, response_format: Type[BaseModel]) -> Type[BaseModel]:
     )
     return json.loads(completion.choices[0].message.content)
 
+# A number followed by an hour or minute unit, e.g. '2 hours', '1.5h', '45 mins'
+DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(hours?|hrs?|h|minutes?|mins?|m)\b', re.IGNORECASE)
+
 def convert_duration_to_minutes(duration_str: str) -> float:
     """
     Convert a duration string like '2 hours' or '45 minutes' to minutes.
     """
-    duration_str = duration_str.lower()
-    if 'hour' in duration_str:
-        # Extract the numeric part before 'hour'
-        hours = float(re.search(r'(\d+(\.\d+)?)', duration_str).group(1))
-        return hours * 60
-    elif 'minute' in duration_str:
-        # Extract the numeric part before 'minute'
-        minutes = float(re.search(r'(\d+(\.\d+)?)', duration_str).group(1))
-        return minutes
-    else:
-        # Default to returning as is if format not recognized
-        try:
-            return float(duration_str)
-        except:
-            return 30.0  # Default 30 minutes if unparseable
+    match = DURATION_PATTERN.search(duration_str)
+    if match:
+        value = float(match.group(1))
+        return value * 60 if match.group(2)[0] in "hH" else value
+    # Default to returning as is if format not recognized
+    try:
+        return float(duration_str)
+    except ValueError:
+        return 30.0  # Default 30 minutes if unparseable
 
 # --- Admin Endpoints ---
 @app.post("/admin/agents")
@@ -171,18 +302,22 @@ def assign_agent(req: AssignRequest):
     db.close()
     return {"status": "assigned", "agent_id": agent.id, "supervisor_id": sup.id}
 
+def rebuild_kb_collection(ids: List[str], embeddings: List[list], metadatas: List[Dict]):
+    """Drop the knowledge base collection and return a new one holding the given chunks."""
+    kb_chroma_client.delete_collection("kb")
+    collection = kb_chroma_client.create_collection("kb", metadata=HNSW_METADATA)
+    if ids:
+        collection.add(ids=ids, embeddings=embeddings, metadatas=metadatas)
+    return collection
+
 @app.post("/admin/knowledge-base")
-def manage_knowledge_base(knowledge_base: str):
+async def manage_knowledge_base(knowledge_base: str):
     """
     Admin uploads a big piece of text as the knowledge base. This endpoint processes the text,
     breaks it into chunks using an LLM, and stores the chunks and their embeddings in the ChromaDB
     for the knowledge base. If the knowledge base already exists, it is destroyed and recreated.
     """
-    
-    existing_chunks = kb_collection.get()
-    if existing_chunks["ids"]:
-        # If the knowledge base exists, delete it
-        kb_collection.delete(where={})  # Deletes all entries in the collection
+    global kb_collection
     kb_chunk_generation_prompt = f"""
     You are an assistant that organizes knowledge bases. Break the following text into smaller chunks,
     where each chunk represents a specific topic or subtopic. Ensure the chunks are concise and meaningful.
@@ -190,24 +325,74 @@ def manage_knowledge_base(knowledge_base: str):
     {knowledge_base}
     Output a JSON array of chunks, where each chunk is a string.
     """
-    kb_chunks = llm_call(kb_chunk_generation_prompt, KBChunkList)
-    for idx, chunk in enumerate(kb_chunks.chunks):
-        # Generate embedding for the chunk
-        embedding = get_embedding(chunk)
-        # Add the chunk to the ChromaDB knowledge base collection
-        kb_collection.add(
-            ids=[f"chunk-{idx + 1}"],  # Unique ID for each chunk
-            embeddings=[embedding],
-            metadatas=[{"chunk_text": chunk}]
-        )
+    kb_chunks = (await llm_call(kb_chunk_generation_prompt, KBChunkList))["chunks"]
+    
+    # Embed every chunk in one batch, then replace the old knowledge base by
+    # dropping its collection and filling a new one; the module-level
+    # collection is only swapped once the new one is complete
+    embeddings = await asyncio.to_thread(get_embeddings, kb_chunks)
+    kb_collection = await asyncio.to_thread(
+        rebuild_kb_collection,
+        [f"chunk-{idx + 1}" for idx in range(len(kb_chunks))],  # Unique ID for each chunk
+        embeddings,
+        [{"chunk_text": chunk} for chunk in kb_chunks]
+    )
     return {"status": "success", "message": "Knowledge base has been created/updated successfully."}
 
+# Pooled HTTP session for Dify calls, opened and closed with the app's event loop;
+# it keeps connections alive and sends the auth headers on every request
+DIFY_MAX_CONNECTIONS = 32
+dify_session: Optional[aiohttp.ClientSession] = None
+
+@app.on_event("startup")
+async def open_dify_session():
+    global dify_session
+    dify_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=DIFY_MAX_CONNECTIONS, ttl_dns_cache=300),
+        headers={
+            "Authorization": f"Bearer {DIFY_API_TOKEN}",
+            "Content-Type": "application/json"
+        }
+    )
+
+@app.on_event("shutdown")
+async def close_dify_session():
+    if dify_session is not None:
+        await dify_session.close()
+
+# Decode JSON with orjson when it is installed
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def strip_think_blocks(answer: str) -> str:
+    """Remove <think>...</think> blocks, and the whitespace after each, in one left-to-right scan."""
+    parts = []
+    pos = 0
+    while True:
+        start = answer.find("<think>", pos)
+        if start < 0:
+            break
+        end = answer.find("</think>", start + 7)
+        if end < 0:
+            break
+        parts.append(answer[pos:start])
+        pos = end + 8
+        while pos < len(answer) and answer[pos].isspace():
+            pos += 1
+    parts.append(answer[pos:])
+    return "".join(parts)
+
+def extract_json_block(answer: str) -> Optional[str]:
+    """Return the contents of the first ```json fenced block in an answer, or None."""
+    start = answer.find("```json")
+    if start < 0:
+        return None
+    end = answer.find("```", start + 7)
+    if end < 0:
+        return None
+    return answer[start + 7:end].strip()
+
 # Utility: call Dify chatbot and parse response
-def call_chatbot(conversation: str) -> List[Dict]:
-    headers = {
-        "Authorization": f"Bearer {DIFY_API_TOKEN}",
-        "Content-Type": "application/json"
-    }
+async def call_chatbot(conversation: str) -> List[Dict]:
     payload = {
         "inputs": {},
         "query": conversation,
@@ -217,23 +402,22 @@ def call_chatbot(conversation: str) -> List[Dict]:
     }
     
     try:
-        resp = requests.post(DIFY_API_URL, json=payload, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
+        async with dify_session.post(DIFY_API_URL, json=payload) as resp:
+            resp.raise_for_status()
+            data = json_loads(await resp.read())
         
         # Extract the answer from the response
         raw_answer = data.get("answer", "")
         
         # Strip <think> blocks
-        sanitized = re.sub(r"<think>.*?</think>\s*", "", raw_answer, flags=re.DOTALL)
+        sanitized = strip_think_blocks(raw_answer)
         
         # Find JSON content in the answer (it's enclosed in ```json ... ```)
-        json_match = re.search(r'```json\s*(.*?)\s*```', sanitized, re.DOTALL)
+        json_str = extract_json_block(sanitized)
         
-        if json_match:
-            json_str = json_match.group(1)
+        if json_str is not None:
             # Parse the JSON content
-            task_list = json.loads(json_str)
+            task_list = json_loads(json_str)
             return task_list
         else:
             # If no JSON found, return an empty list
@@ -245,99 +429,145 @@ def call_chatbot(conversation: str) -> List[Dict]:
         return []
 
 # --- Transcript and Task Endpoints ---
+def agent_exists(agent_id: int) -> bool:
+    """Check for an agent by primary key without loading the row."""
+    db = SessionLocal()
+    try:
+        return db.query(Agent.id).filter(Agent.id == agent_id).first() is not None
+    finally:
+        db.close()
+
+def save_transcript(agent_id: int, content: str) -> int:
+    """Store a transcript for an agent and return its ID."""
+    db = SessionLocal()
+    try:
+        db_trans = Transcript(
+            agent_id=agent_id, 
+            content=content, 
+            created_at=datetime.now(timezone.utc)
+        )
+        db.add(db_trans)
+        db.commit()
+        db.refresh(db_trans)
+        return db_trans.id
+    finally:
+        db.close()
+
+def save_tasks(transcript_id: int, agent_id: int, task_items: List[Dict]) -> List[TaskInfoResponse]:
+    """Store extracted tasks in the DB and return them as response models."""
+    # Extract task descriptions and convert duration strings to minutes
+    descriptions = [task_item.get("task", "") for task_item in task_items]
+    durations = [
+        convert_duration_to_minutes(task_item.get("estimated_duration", "30 minutes"))
+        for task_item in task_items
+    ]
+    
+    # All tasks of one upload share a single creation time
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    
+    # Insert every Task entry in one flush and commit them together; the flush assigns their IDs
+    db = SessionLocal()
+    try:
+        db_tasks = [
+            Task(
+                transcript_id=transcript_id,
+                agent_id=agent_id,
+                description=description,
+                estimated_duration=duration_minutes,
+                actual_duration=None,
+                status=TaskStatus.PENDING.value,
+                created_at=now,
+                completed_at=None
+            )
+            for description, duration_minutes in zip(descriptions, durations)
+        ]
+        db.add_all(db_tasks)
+        db.flush()
+        task_ids = [db_task.id for db_task in db_tasks]
+        db.commit()
+    finally:
+        db.close()
+    
+    # FastAPI validates the response against its response_model on the way
+    # out, so build these trusted values without validating them a second time
+    return [
+        TaskInfoResponse.model_construct(
+            id=str(task_id),
+            transcript_id=transcript_id,
+            agent_id=agent_id,
+            description=description,
+            estimated_duration=duration_minutes,
+            actual_duration=None,
+            status=TaskStatus.PENDING.value,
+            created_at=now_iso,
+            completed_at=None
+        )
+        for task_id, description, duration_minutes in zip(task_ids, descriptions, durations)
+    ]
+
+def index_tasks(tasks_info: List[TaskInfoResponse]):
+    """Embed stored tasks in one batch and add them to ChromaDB together."""
+    try:
+        embeddings = get_embeddings([task.description for task in tasks_info])
+        task_collection.add(
+            ids=[f"{task.transcript_id}-{idx + 1}" for idx, task in enumerate(tasks_info)],
+            embeddings=embeddings,
+            metadatas=[{
+                "id": task.id,
+                "transcript_id": task.transcript_id,
+                "agent_id": task.agent_id,
+                "description": task.description,
+                "estimated_duration": task.estimated_duration,
+                "status": task.status,
+                "created_at": task.created_at
+            } for task in tasks_info]
+        )
+    except Exception as e:
+        # Runs after the response was sent, so there is no caller to report to
+        print(f"Error indexing tasks in ChromaDB: {str(e)}")
+
 @app.post("/transcripts", response_model=TranscriptTasksResponse)
-def create_transcript(transcript: TranscriptCreate):
+async def create_transcript(transcript: TranscriptCreate, background_tasks: BackgroundTasks):
     """
     Agent uploads a call transcript. We create a Transcript entry, then use LLM
     to extract tasks with estimated durations, create Task entries, and store them.
+    Blocking DB work runs in worker threads so the event loop keeps serving
+    other requests while this one waits on Dify; embedding the tasks and adding
+    them to ChromaDB happens after the response is sent.
     """
-    db = SessionLocal()
-    agent = db.query(Agent).get(transcript.agent_id)
-    if not agent:
-        db.close()
+    content = transcript.content.strip() or SAMPLE_CONVERSATION
+    
+    # Check the agent first so an unknown agent never costs a Dify call
+    if not await asyncio.to_thread(agent_exists, transcript.agent_id):
         raise HTTPException(status_code=404, detail="Agent not found")
     
+    # Start extracting tasks with Dify now so its round-trip overlaps the transcript insert
+    dify_task = asyncio.create_task(call_chatbot(content))
+    
     # Save transcript in DB
-    content = transcript.content.strip() or SAMPLE_CONVERSATION
-    db_trans = Transcript(
-        agent_id=transcript.agent_id, 
-        content=content, 
-        created_at=datetime.now(timezone.utc)
-    )
-    db.add(db_trans)
-    db.commit()
-    db.refresh(db_trans)
+    try:
+        transcript_id = await asyncio.to_thread(save_transcript, transcript.agent_id, content)
+    except Exception:
+        dify_task.cancel()
+        raise
     
     # Extract tasks from transcript using Dify
     try:
-        task_items = call_chatbot(content)
+        task_items = await dify_task
     except Exception as e:
         # fallback to hardcoded if API fails
-        task_items = call_chatbot(SAMPLE_CONVERSATION)
+        task_items = await call_chatbot(SAMPLE_CONVERSATION)
     
     # If no tasks were found, return an empty list
     if not task_items:
-        db.close()
-        return {"transcript_id": db_trans.id, "tasks": []}
+        return {"transcript_id": transcript_id, "tasks": []}
     
-    # Process tasks: store in DB and ChromaDB
-    tasks_info = []
-    for idx, task_item in enumerate(task_items):
-        # Extract task description and duration
-        description = task_item.get("task", "")
-        duration_str = task_item.get("estimated_duration", "30 minutes")
-        
-        # Convert duration string to minutes
-        duration_minutes = convert_duration_to_minutes(duration_str)
-        
-        # Create a new Task entry
-        db_task = Task(
-            transcript_id=db_trans.id,
-            agent_id=transcript.agent_id,
-            description=description,
-            estimated_duration=duration_minutes,
-            actual_duration=None,
-            status=TaskStatus.PENDING.value,
-            created_at=datetime.now(timezone.utc),
-            completed_at=None
-        )
-        db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
-        
-        # Generate embedding for the task description
-        embedding = get_embedding(description)
-        
-        # Add task to ChromaDB
-        task_collection.add(
-            ids=[f"{db_trans.id}-{idx + 1}"],
-            embeddings=[embedding],
-            metadatas=[{
-                "id": str(db_task.id),
-                "transcript_id": db_trans.id,
-                "agent_id": transcript.agent_id,
-                "description": description,
-                "estimated_duration": duration_minutes,
-                "status": TaskStatus.PENDING.value,
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }]
-        )
-        
-        # Add to response
-        tasks_info.append(TaskInfoResponse(
-            id=str(db_task.id),
-            transcript_id=db_trans.id,
-            agent_id=transcript.agent_id,
-            description=description,
-            estimated_duration=duration_minutes,
-            actual_duration=None,
-            status=TaskStatus.PENDING.value,
-            created_at=datetime.now(timezone.utc).isoformat(),
-            completed_at=None
-        ))
+    # Store tasks in the DB, then index them in ChromaDB once the response is out
+    tasks_info = await asyncio.to_thread(save_tasks, transcript_id, transcript.agent_id, task_items)
+    background_tasks.add_task(index_tasks, tasks_info)
     
-    db.close()
-    return {"transcript_id": db_trans.id, "tasks": tasks_info}
+    return {"transcript_id": transcript_id, "tasks": tasks_info}
 
 @app.get("/agents/{agent_id}/tasks")
 def get_agent_tasks(agent_id: int):
@@ -347,15 +577,12 @@ def get_agent_tasks(agent_id: int):
     if not agent:
         db.close()
         raise HTTPException(status_code=404, detail="Agent not found")
-    tasks = db.query(Task).filter(Task.agent_id == agent_id).all()
-    result = [{
-        "id": t.id,
-        "transcript_id": t.transcript_id,
-        "description": t.description,
-        "estimated_duration": t.estimated_duration,
-        "actual_duration": t.actual_duration,
-        "status": t.status
-    } for t in tasks]
+    # Select only the returned columns, as plain rows rather than Task instances
+    rows = db.query(Task).filter(Task.agent_id == agent_id).with_entities(
+        Task.id, Task.transcript_id, Task.description,
+        Task.estimated_duration, Task.actual_duration, Task.status
+    ).all()
+    result = [dict(row._mapping) for row in rows]
     db.close()
     return result
 
@@ -372,21 +599,31 @@ def get_supervisor_metrics(sup_id: int):
     if not sup:
         db.close()
         raise HTTPException(status_code=404, detail="Supervisor not found")
+    # Aggregate every agent's tasks in one grouped query; AVG skips the NULL
+    # durations of tasks the agent couldn't do or hasn't timed
+    rows = (
+        db.query(
+            Agent.id,
+            Agent.name,
+            func.avg(case((Task.status == "cant_do", None), else_=Task.actual_duration)),
+            func.count(Task.id),
+            func.sum(case((Task.status == "delayed", 1), else_=0)),
+            func.sum(case((Task.status == "cant_do", 1), else_=0))
+        )
+        .outerjoin(Task, Task.agent_id == Agent.id)
+        .filter(Agent.sup_id == sup_id)
+        .group_by(Agent.id, Agent.name)
+        .order_by(Agent.id)
+        .all()
+    )
     metrics = []
-    for agent in sup.agents:
-        tasks = agent.tasks
-        total_tasks = len(tasks)
-        done_tasks = [t for t in tasks if t.status != "cant_do"]
-        total_time = sum(t.actual_duration for t in done_tasks if t.actual_duration is not None)
-        count_done = len([t for t in done_tasks if t.actual_duration is not None])
-        avg_acw = (total_time / count_done) if count_done > 0 else 0.0
-        delays = sum(1 for t in tasks if t.status == "delayed")
-        cants = sum(1 for t in tasks if t.status == "cant_do")
+    for agent_id, agent_name, avg_acw, total_tasks, delays, cants in rows:
+        avg_acw = avg_acw if avg_acw is not None else 0.0
         delay_pct = (delays / total_tasks * 100) if total_tasks else 0.0
         cant_pct = (cants / total_tasks * 100) if total_tasks else 0.0
         metrics.append({
-            "agent_id": agent.id,
-            "agent_name": agent.name,
+            "agent_id": agent_id,
+            "agent_name": agent_name,
             "avg_acw": round(avg_acw, 2),
             "delay_percent": round(delay_pct, 1),
             "cant_do_percent": round(cant_pct, 1)
@@ -405,17 +642,21 @@ def get_supervisor_alerts(sup_id: int):
     if not sup:
         db.close()
         raise HTTPException(status_code=404, detail="Supervisor not found")
-    alerts = []
-    for agent in sup.agents:
-        for t in agent.tasks:
-            if t.status in ("delayed", "cant_do"):
-                alerts.append({
-                    "agent_id": agent.id,
-                    "transcript_id": t.transcript_id,
-                    "task_id": t.id,
-                    "description": t.description,
-                    "status": t.status
-                })
+    # Fetch the flagged tasks of all the supervisor's agents in one query
+    rows = (
+        db.query(Task.agent_id, Task.transcript_id, Task.id, Task.description, Task.status)
+        .join(Agent, Task.agent_id == Agent.id)
+        .filter(Agent.sup_id == sup_id, Task.status.in_(("delayed", "cant_do")))
+        .order_by(Task.agent_id, Task.id)
+        .all()
+    )
+    alerts = [{
+        "agent_id": agent_id,
+        "transcript_id": transcript_id,
+        "task_id": task_id,
+        "description": description,
+        "status": status
+    } for agent_id, transcript_id, task_id, description, status in rows]
     db.close()
     return {"alerts": alerts}
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 from enum import Enum
@@ -11,7 +11,7 @@ class Agent(Base):
     __tablename__ = 'agents'
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
-    sup_id = Column(Integer, ForeignKey('supervisors.id'), nullable=True)
+    sup_id = Column(Integer, ForeignKey('supervisors.id'), nullable=True, index=True)
     transcripts = relationship("Transcript", back_populates="agent")
     tasks = relationship("Task", back_populates="agent")
     supervisor = relationship("Supervisor", back_populates="agents")
@@ -44,6 +44,8 @@ class Task(Base):
     completed_at = Column(DateTime, nullable=True)
     transcript = relationship("Transcript", back_populates="tasks")
     agent = relationship("Agent", back_populates="tasks")
+    # Per-agent status lookups (alerts, metrics) are answered from this index
+    __table_args__ = (Index('ix_tasks_agent_status', 'agent_id', 'status'),)
 
 class TaskStatus(Enum):
     PENDING = "Pending"